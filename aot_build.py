@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+===============================================================================
+AOT_BUILD.PY - FSM çekirdeğinin önceden derlenmesi (AOT)
+===============================================================================
+njit(cache=True) derlemeyi diskte saklar ama ilk çalıştırma yine
+derleme bekletir. Bu betik state_machine._fsm_step'i numba'nın AOT
+derleyicisiyle yerel koda çevirip state_machine_aot*.so dosyasını
+paket dizinine bırakır; state_machine import sırasında bu modülü
+bulursa JIT beklemeden hazır makine kodunu yükler. __main__ smoke
+testinin açılışı saniyelerden milisaniyelere iner.
+
+Kullanım:
+    python aot_build.py
+
+FSM geçiş mantığı (_fsm_step / _NEXT_STATE) değiştiğinde yeniden
+çalıştırılmalıdır - aksi halde bayat .so eski davranışı döndürür.
+===============================================================================
+"""
+
+from numba.pycc import CC
+
+import state_machine
+
+_core = state_machine._fsm_step_py
+
+cc = CC('state_machine_aot')
+cc.export('fsm_step', 'i8(i8, b1, f8, f8, f8, f8, f8)')(_core)
+
+
+if __name__ == '__main__':
+    cc.compile()
+    print("✅ state_machine_aot derlendi")
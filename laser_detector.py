@@ -7,12 +7,11 @@ LASER_DETECTOR.PY - Lazer Tespit Modülü
 940nm IR lazer beacon tespiti için görüntü işleme modülü.
 
 Algoritma:
-  1. Frame yakala (kamera veya CSI)
-  2. Grayscale'e çevir
-  3. Threshold uygula (lazer çok parlak)
-  4. Kontur bul
-  5. Dairesellik ve alan filtrele
-  6. En uygun noktayı seç (centroid)
+  1. Frame yakala (Y düzlemi / grayscale - renk dönüşümü yok)
+  2. Threshold uygula (lazer çok parlak)
+  3. Kontur bul
+  4. Dairesellik ve alan filtrele
+  5. En uygun noktayı seç (centroid)
 
 Desteklenen Kameralar:
   - Raspberry Pi Camera (picamera2)
@@ -31,8 +30,10 @@ Not:
 """
 
 import time
+import queue
 import threading
 import logging
+import functools
 from typing import Optional, Tuple, List
 
 import numpy as np
@@ -47,15 +48,204 @@ except ImportError:
 
 # Picamera2 (Raspberry Pi Camera Module)
 try:
-    from picamera2 import Picamera2
+    from picamera2 import Picamera2, MappedArray
     PICAMERA2_AVAILABLE = True
 except ImportError:
     PICAMERA2_AVAILABLE = False
     logging.info("picamera2 kurulu değil - USB kamera kullanılacak")
 
+# Numba (JIT derleme - opsiyonel)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logging.info("numba kurulu değil - Kalman saf NumPy ile çalışacak")
+
 # Config import
 from config import *
 
+# Kaba arama ölçeği: tespit önce bu ölçekte yapılır, sonra tam çözünürlükte
+# sadece blob çevresindeki ROI rafine edilir (1/16 piksel = ~16x az bant genişliği)
+_COARSE_SCALE = 0.25
+
+# ROI kenar payı (tam çözünürlük piksel) - kaba bbox'ın etrafına eklenir
+_ROI_MARGIN = 8
+
+# Morfoloji kernel'i - her detect_laser çağrısında np.ones ile yeniden
+# ayırmak yerine modül yüklenirken bir kez oluşturulur
+_MORPH_KERNEL = (cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+                 if CV2_AVAILABLE else None)
+
+# Aday kaydı: dict listesi yerine SoA (structure-of-arrays) yerleşimi.
+# Frame başına küçük dict'ler ayırmak GC baskısı yaratır; sabit boyutlu
+# structured array bir kez ayrılır ve her frame yeniden doldurulur
+_MAX_CANDIDATES = 32
+_CANDIDATE_DTYPE = np.dtype([
+    ('cx', 'i4'), ('cy', 'i4'),          # merkez (global piksel)
+    ('area', 'f4'), ('circ', 'f4'),      # alan ve dairesellik
+    ('bx', 'i4'), ('by', 'i4'),          # bbox sol-üst (global)
+    ('bw', 'i4'), ('bh', 'i4'),          # bbox boyutu
+])
+
+
+@functools.lru_cache(maxsize=64)
+def _render_text(text: str, color: Tuple[int, int, int],
+                 scale: float = 0.6) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Metni küçük bir BGR patch'ine bir kez rasterize et (memoized).
+
+    "FPS: 60.0" / "Thresh: 200" gibi nadiren değişen etiketler için
+    putText'in glyph rasterizasyonu her frame'de tekrarlanmasın diye
+    sonuç lru_cache ile saklanır.
+
+    Returns:
+        Tuple[patch, mask]: BGR patch ve blit maskesi
+    """
+    (text_w, text_h), baseline = cv2.getTextSize(
+        text, cv2.FONT_HERSHEY_SIMPLEX, scale, 2)
+    patch = np.zeros((text_h + baseline, max(text_w, 1), 3), np.uint8)
+    cv2.putText(patch, text, (0, text_h),
+                cv2.FONT_HERSHEY_SIMPLEX, scale, color, 2)
+    mask = patch.any(axis=2, keepdims=True)
+    return patch, mask
+
+
+def _blit_text(img: np.ndarray, text: str, org: Tuple[int, int],
+               color: Tuple[int, int, int], scale: float = 0.6):
+    """
+    Cache'lenmiş metin patch'ini frame'e kopyala.
+
+    org, putText ile aynı anlamda: metnin sol-alt (baseline) noktası.
+    """
+    patch, mask = _render_text(text, color, scale)
+    patch_h, patch_w = patch.shape[:2]
+    x, y = org
+    top = max(0, y - patch_h)
+    x1 = min(img.shape[1], x + patch_w)
+    y1 = min(img.shape[0], top + patch_h)
+    region = img[top:y1, x:x1]
+    np.copyto(region, patch[:region.shape[0], :region.shape[1]],
+              where=mask[:region.shape[0], :region.shape[1]])
+
+
+def _uf_find(parent, i):
+    """Union-find kök bulma (path halving)."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _scan_blobs(roi, threshold):
+    """
+    Küçük ROI'de tek geçişli parlak blob taraması.
+
+    LASER_MAX_AREA=500 → lazer en fazla ~23x23 piksel; blob sayısı düşük.
+    Bu durumda threshold + morfoloji + genel amaçlı CCL zinciri yerine
+    elle yazılmış tarama daha ucuz: eşiği geçen pikseller union-find ile
+    etiketlenir, momentler (alan, ağırlık merkezi, bbox) aynı geçişte
+    birikir. Ara ikili görüntü üretilmez.
+
+    Tek piksellik gürültü ayrı blob olur ve min_area filtresi tarafından
+    elenir - morfolojik açmanın yaptığı işin eşdeğeri.
+
+    Returns:
+        Tuple[n, stats, centroids]: blob sayısı, (x,y,w,h,area) int32
+        satırları ve float64 ağırlık merkezleri (ROI-yerel)
+    """
+    h, w = roi.shape
+    max_labels = 64
+    labels = np.zeros((h, w), np.int32)
+    parent = np.arange(max_labels + 1).astype(np.int32)
+    n = 0
+
+    # 1. geçiş: etiketle + komşu etiketleri birleştir (8-bağlantı)
+    for yy in range(h):
+        for xx in range(w):
+            if roi[yy, xx] < threshold:
+                continue
+            left = labels[yy, xx - 1] if xx > 0 else 0
+            up_l = labels[yy - 1, xx - 1] if (yy > 0 and xx > 0) else 0
+            up = labels[yy - 1, xx] if yy > 0 else 0
+            up_r = labels[yy - 1, xx + 1] if (yy > 0 and xx < w - 1) else 0
+
+            m = 0
+            if left and (m == 0 or left < m):
+                m = left
+            if up_l and (m == 0 or up_l < m):
+                m = up_l
+            if up and (m == 0 or up < m):
+                m = up
+            if up_r and (m == 0 or up_r < m):
+                m = up_r
+
+            if m == 0:
+                # Yeni blob (etiket alanı dolarsa piksel atlanır -
+                # bu noktada frame zaten lazer olamayacak kadar gürültülü)
+                if n < max_labels:
+                    n += 1
+                    labels[yy, xx] = n
+            else:
+                labels[yy, xx] = m
+                if left and left != m:
+                    parent[_uf_find(parent, left)] = _uf_find(parent, m)
+                if up_l and up_l != m:
+                    parent[_uf_find(parent, up_l)] = _uf_find(parent, m)
+                if up and up != m:
+                    parent[_uf_find(parent, up)] = _uf_find(parent, m)
+                if up_r and up_r != m:
+                    parent[_uf_find(parent, up_r)] = _uf_find(parent, m)
+
+    # 2. geçiş: kök başına momentleri biriktir
+    count = np.zeros(max_labels + 1, np.int64)
+    sum_x = np.zeros(max_labels + 1, np.int64)
+    sum_y = np.zeros(max_labels + 1, np.int64)
+    min_x = np.full(max_labels + 1, w, np.int32)
+    min_y = np.full(max_labels + 1, h, np.int32)
+    max_x = np.zeros(max_labels + 1, np.int32)
+    max_y = np.zeros(max_labels + 1, np.int32)
+    for yy in range(h):
+        for xx in range(w):
+            lab = labels[yy, xx]
+            if lab == 0:
+                continue
+            r = _uf_find(parent, lab)
+            count[r] += 1
+            sum_x[r] += xx
+            sum_y[r] += yy
+            if xx < min_x[r]:
+                min_x[r] = xx
+            if xx > max_x[r]:
+                max_x[r] = xx
+            if yy < min_y[r]:
+                min_y[r] = yy
+            if yy > max_y[r]:
+                max_y[r] = yy
+
+    # Kökleri kompakt çıktıya topla (connectedComponentsWithStats düzeni)
+    stats = np.zeros((max_labels, 5), np.int32)
+    centroids = np.zeros((max_labels, 2), np.float64)
+    n_out = 0
+    for lab in range(1, n + 1):
+        if parent[lab] != lab or count[lab] == 0:
+            continue
+        stats[n_out, 0] = min_x[lab]
+        stats[n_out, 1] = min_y[lab]
+        stats[n_out, 2] = max_x[lab] - min_x[lab] + 1
+        stats[n_out, 3] = max_y[lab] - min_y[lab] + 1
+        stats[n_out, 4] = count[lab]
+        centroids[n_out, 0] = sum_x[lab] / count[lab]
+        centroids[n_out, 1] = sum_y[lab] / count[lab]
+        n_out += 1
+
+    return n_out, stats, centroids
+
+
+if NUMBA_AVAILABLE:
+    _uf_find = njit(cache=True)(_uf_find)
+    _scan_blobs = njit(cache=True, fastmath=True)(_scan_blobs)
+
 
 class LaserDetector:
     """
@@ -73,7 +263,7 @@ class LaserDetector:
         >>> detector = LaserDetector((1456, 1088), threshold=200)
         >>> detector.start()
         >>> frame = detector.capture_frame()
-        >>> pos, processed = detector.detect_laser(frame)
+        >>> pos = detector.detect_laser(frame)
         >>> print(f"Lazer pozisyonu: {pos}")
     """
     
@@ -101,11 +291,71 @@ class LaserDetector:
         # Kamera instance
         self._camera = None
         self._camera_type = None  # 'picamera2' veya 'opencv'
-        
-        # Son işlenmiş frame (web stream için)
-        self._processed_frame = None
+
+        # Kamera yakalama thread'i: kamera DMA/IO'su tespit CPU işiyle
+        # örtüşsün diye capture ayrı thread'de koşar. Tek slotluk kuyruk
+        # her zaman en taze frame'i tutar (dolu ise eskisi atılır)
+        self._frame_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._capture_thread: Optional[threading.Thread] = None
+        self._capture_running = False
+        self._latest_frame = None
+
+        # Son ham frame + tespit sonucu (web stream görselleştirmesi için)
+        # Overlay çizimi hot path'te değil get_processed_frame'de yapılır.
+        # _last_best: _last_candidates içine indeks (-1 = tespit yok)
+        self._last_raw = None
+        self._last_candidates: Optional[np.ndarray] = None
+        self._last_best = -1
         self._frame_lock = threading.Lock()
+
+        # Stream tarafı yeni sonucu polling yerine bu event ile bekler;
+        # JPEG encode tespit thread'inde değil tüketici tarafında yapılır
+        self._new_result_event = threading.Event()
         
+        # Önceden ayrılmış buffer'lar - kaba arama geçişi her frame'de
+        # yeni array ayırmasın diye (hot path'te sıfır alloc).
+        # Boyutlar pyrDown zinciriyle uyumlu: her adım (n+1)//2
+        half_w = (resolution[0] + 1) // 2
+        half_h = (resolution[1] + 1) // 2
+        small_w = (half_w + 1) // 2
+        small_h = (half_h + 1) // 2
+        self._half_buf = np.empty((half_h, half_w), np.uint8)
+        self._small_buf = np.empty((small_h, small_w), np.uint8)
+        self._small_bin_buf = np.empty((small_h, small_w), np.uint8)
+
+        # Aday SoA buffer'ı - her frame'de dict listesi yerine bu array
+        # doldurulur (sıralama/argmax NumPy tarafında kalır)
+        self._cand = np.empty(_MAX_CANDIDATES, dtype=_CANDIDATE_DTYPE)
+
+        # picamera2 sıfır-alloc yakalama: Y düzlemi DMA buffer'ından
+        # havuzdan alınan bir buffer'a kopyalanır (capture_array her
+        # çağrıda yeni ndarray ayırır). Kör dönüşümlü çift buffer
+        # yerine dönüş havuzu (return-to-pool): sahiplik yakalama →
+        # kuyruk → tespit → _last_raw zinciri boyunca el değiştirir ve
+        # buffer ancak hiçbir tüketici tutmazken havuza döner - bir
+        # tüketici okurken üzerine asla yazılmaz. 4 buffer: yakalama +
+        # kuyruk + yayınlanmış frame + boşta bir yedek
+        self._y_buf_pool: queue.Queue = queue.Queue()
+        _pool_bufs = [np.empty((resolution[1], resolution[0]), np.uint8)
+                      for _ in range(4)]
+        self._y_pool_ids = frozenset(id(b) for b in _pool_bufs)
+        for _buf in _pool_bufs:
+            self._y_buf_pool.put_nowait(_buf)
+
+        # Overlay çıktısı için çift BGR buffer: ~4.5MB'lık frame her
+        # stream tick'inde yeniden ayrılmasın. İki buffer dönüşümlü
+        # kullanılır - encoder biri üzerinde çalışırken bir sonraki
+        # get_processed_frame çağrısı diğerine yazar
+        self._proc_bufs = (np.empty((resolution[1], resolution[0], 3),
+                                    np.uint8),
+                           np.empty((resolution[1], resolution[0], 3),
+                                    np.uint8))
+        self._proc_buf_idx = 0
+
+        # Debug modunda ilk frame'de bir kez giriş formatı doğrulanır
+        # (uint8 + C-contiguous → threshold'un AVX2/NEON kernel'i)
+        self._input_checked = not DEBUG_MODE
+
         # İstatistikler
         self._frame_count = 0
         self._detection_count = 0
@@ -134,10 +384,20 @@ class LaserDetector:
             try:
                 self._logger.info("Picamera2 başlatılıyor...")
                 self._camera = Picamera2()
-                
+
                 # Video konfigürasyonu
+                # Tespit için sadece parlaklık (Y düzlemi) gerekli.
+                # lores YUV420 stream'inden Y düzlemini doğrudan okuyoruz;
+                # RGB→BGR→GRAY dönüşümleri tamamen atlanır (frame başına
+                # ~5 MB bellek trafiği tasarrufu).
+                # queue=False: capture_request kuyrukta bekleyen eski bir
+                # frame yerine her zaman sensörden gelen bir SONRAKİ
+                # frame'i döndürür - bayat frame gecikmesi sıfırlanır
                 config = self._camera.create_video_configuration(
-                    main={"size": self.resolution, "format": "RGB888"}
+                    main={"size": self.resolution, "format": "RGB888"},
+                    lores={"size": self.resolution, "format": "YUV420"},
+                    buffer_count=4,
+                    queue=False
                 )
                 self._camera.configure(config)
                 self._camera.start()
@@ -147,6 +407,7 @@ class LaserDetector:
                 
                 self._camera_type = 'picamera2'
                 self._logger.info(f"✅ Picamera2 başlatıldı: {self.resolution}")
+                self._start_capture_thread()
                 return True
                 
             except Exception as e:
@@ -157,7 +418,9 @@ class LaserDetector:
         if CV2_AVAILABLE:
             try:
                 self._logger.info("USB kamera başlatılıyor...")
-                self._camera = cv2.VideoCapture(CAMERA_DEVICE_ID)
+                # V4L2 backend'i açıkça seç: BUFFERSIZE gibi özellikleri
+                # güvenilir şekilde uygulayan tek backend
+                self._camera = cv2.VideoCapture(CAMERA_DEVICE_ID, cv2.CAP_V4L2)
                 
                 if not self._camera.isOpened():
                     raise Exception("Kamera açılamadı")
@@ -165,9 +428,18 @@ class LaserDetector:
                 # Çözünürlük ayarla
                 self._camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.resolution[0])
                 self._camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.resolution[1])
-                
+
                 # FPS ayarla
                 self._camera.set(cv2.CAP_PROP_FPS, CAMERA_FPS)
+
+                # Tespit grayscale çalışır - BGR dönüşümünü sürücüde kapat
+                # GREY fourcc destekleyen kameralar doğrudan tek kanal verir,
+                # desteklemeyenler MJPG'ye düşer
+                self._camera.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+                if not self._camera.set(cv2.CAP_PROP_FOURCC,
+                                        cv2.VideoWriter_fourcc(*'GREY')):
+                    self._camera.set(cv2.CAP_PROP_FOURCC,
+                                     cv2.VideoWriter_fourcc(*'MJPG'))
                 
                 # Buffer boyutunu küçük tut (düşük latency için)
                 self._camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
@@ -179,6 +451,7 @@ class LaserDetector:
                 actual_h = int(self._camera.get(cv2.CAP_PROP_FRAME_HEIGHT))
                 
                 self._logger.info(f"✅ USB kamera başlatıldı: {actual_w}x{actual_h}")
+                self._start_capture_thread()
                 return True
                 
             except Exception as e:
@@ -188,10 +461,120 @@ class LaserDetector:
         self._logger.error("Hiçbir kamera başlatılamadı!")
         return False
     
+    def _start_capture_thread(self):
+        """
+        Yakalama thread'ini başlat.
+
+        Kamera I/O'su tespit işinden ayrılır: capture bu thread'de döner,
+        tespit döngüsü get_latest_frame() ile en taze frame'i alır.
+        """
+        self._capture_running = True
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop,
+            daemon=True,
+            name="CameraCapture"
+        )
+        self._capture_thread.start()
+
+    def _capture_loop(self):
+        """
+        Yakalama döngüsü (ayrı thread).
+
+        En taze frame'i tek slotluk kuyruğa koyar; kuyruk doluysa
+        eski frame atılır (drop-on-full) - tespit her zaman günceli görür.
+        """
+        while self._capture_running:
+            frame = self.capture_frame()
+            if frame is None:
+                time.sleep(0.01)
+                continue
+
+            try:
+                self._frame_queue.put_nowait(frame)
+            except queue.Full:
+                # Eski frame'i at (sahipsiz kaldı - havuza dön), yenisini koy
+                try:
+                    self._recycle_y_buf(self._frame_queue.get_nowait())
+                except queue.Empty:
+                    pass
+                try:
+                    self._frame_queue.put_nowait(frame)
+                except queue.Full:
+                    pass
+
+    def _recycle_y_buf(self, buf: Optional[np.ndarray]):
+        """
+        Sahipsiz kalan Y buffer'ını havuza geri ver.
+
+        Yalnızca havuz üyeleri döner; havuz dışı frame'ler (OpenCV
+        retrieve çıktısı, harici test girişleri, taşma anında ayrılan
+        taze buffer'lar) GC'ye bırakılır.
+        """
+        if buf is not None and id(buf) in self._y_pool_ids:
+            self._y_buf_pool.put_nowait(buf)
+
+    def _release_raw(self, old_raw: Optional[np.ndarray],
+                     frame: np.ndarray):
+        """
+        Yayından düşen önceki _last_raw buffer'ını havuza döndür.
+
+        Stream tarafı (get_processed_frame) raw'ı kilit altında BGR'ye
+        kopyaladığından, yayından düşen buffer'ı kilit bırakıldıktan
+        sonra hiçbir tüketici tutmaz; yalnızca hâlâ _latest_frame olan
+        veya aynı frame'le yeniden yayınlanan buffer tutulmaya devam
+        eder.
+        """
+        if (old_raw is not None and old_raw is not frame
+                and old_raw is not self._latest_frame):
+            self._recycle_y_buf(old_raw)
+
+    def get_latest_frame(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        En taze frame'i al.
+
+        timeout verilmezse bloklamaz; kuyruk boşsa son bilinen frame
+        yeniden kullanılır. timeout verilirse yeni frame gelene kadar
+        (en çok timeout saniye) beklenir - tespit thread'i her frame'i
+        tam bir kez işlemek için bunu kullanır. Bu yolda süre dolunca
+        None döner, bayat frame DEĞİL: kamera ölürse tespit döngüsü
+        eski frame'i taze zaman damgasıyla yeniden işleyip kontrol
+        döngüsünün bayatlık korumasını boşa çıkarmamalı (donmuş lazer
+        LOST'a geçişi engellerdi).
+
+        Returns:
+            np.ndarray: Grayscale frame veya None (frame yoksa /
+                        timeout doldu)
+        """
+        try:
+            if timeout is not None:
+                frame = self._frame_queue.get(timeout=timeout)
+            else:
+                frame = self._frame_queue.get_nowait()
+        except queue.Empty:
+            if timeout is not None:
+                return None
+            return self._latest_frame
+
+        # Önceki frame'in sahipliği burada biter - tespit onu
+        # yayınlamadıysa (detect_laser araya girmediyse) havuza dön.
+        # _last_raw ataması da bu çağıranın thread'inde yapıldığından
+        # kilitsiz kimlik karşılaştırması yeterli
+        prev = self._latest_frame
+        self._latest_frame = frame
+        if prev is not None and prev is not self._last_raw:
+            self._recycle_y_buf(prev)
+        return frame
+
     def stop(self):
         """
         Kamerayı durdur ve kaynakları serbest bırak.
         """
+        # Önce yakalama thread'ini durdur
+        if self._capture_thread:
+            self._capture_running = False
+            self._capture_thread.join(timeout=1.0)
+            self._capture_thread = None
+
         if self._camera:
             if self._camera_type == 'picamera2':
                 self._camera.stop()
@@ -207,25 +590,60 @@ class LaserDetector:
     
     def capture_frame(self) -> Optional[np.ndarray]:
         """
-        Kameradan bir frame yakala.
-        
+        Kameradan bir grayscale frame yakala.
+
+        Tespit pipeline'ı sadece parlaklık kullanır; renk dönüşümü yapılmaz.
+
         Returns:
-            np.ndarray: BGR formatında frame veya None
+            np.ndarray: Grayscale (tek kanal) frame veya None
         """
         if not self._camera:
             return None
-        
+
         try:
             if self._camera_type == 'picamera2':
-                # Picamera2 RGB888 formatında döndürür
-                frame = self._camera.capture_array()
-                # RGB → BGR (OpenCV formatı)
-                frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-                
+                # YUV420 lores stream: ilk h satır Y (parlaklık) düzlemi.
+                # Satır genişliği stride'a hizalı olabilir - w'ye kırp.
+                # capture_request + MappedArray: DMA buffer'ı üzerine view
+                # alınır ve tek memcpy ile önceden ayrılmış buffer'a
+                # kopyalanır - frame başına ndarray ayrılmaz, cvtColor yok
+                w, h = self.resolution
+                try:
+                    frame = self._y_buf_pool.get_nowait()
+                except queue.Empty:
+                    # Tüm havuz buffer'ları tüketicilerde (nadir, ağır
+                    # yük) - taze buffer ayır; havuz üyesi olmadığından
+                    # geri dönmez, GC toplar
+                    frame = np.empty((h, w), np.uint8)
+                request = self._camera.capture_request()
+                try:
+                    with MappedArray(request, "lores") as mapped:
+                        np.copyto(frame, mapped.array[:h, :w])
+                finally:
+                    request.release()
+
             elif self._camera_type == 'opencv':
-                ret, frame = self._camera.read()
+                # CAP_PROP_BUFFERSIZE=1 her backend'de uygulanmaz - kernel
+                # tamponunda bekleyen eski frame'leri açıkça boşalt.
+                # Tampondan gelen grab() anında döner, sensörden gelen
+                # frame süresi kadar bekler: hızlı dönen grab'ler atlanır
+                stale_limit = 0.5 / CAMERA_FPS
+                for _ in range(3):
+                    t0 = time.time()
+                    if not self._camera.grab():
+                        return None
+                    if time.time() - t0 > stale_limit:
+                        break
+
+                ret, frame = self._camera.retrieve()
                 if not ret:
                     return None
+                # CONVERT_RGB=0 desteklenmeyen backend'ler BGR döndürebilir.
+                # cvtColor'ın 3 kanallı ağırlıklı toplamı yerine tek kanal
+                # yeterli: 940nm IR, IR-cut filtresiz sensörde en çok kırmızı
+                # kanala sızar. Slice bir view - kopya/dönüşüm yok.
+                if frame.ndim == 3:
+                    frame = frame[:, :, 2]
             
             self._frame_count += 1
             
@@ -237,170 +655,253 @@ class LaserDetector:
                 self._fps = self._fps_frame_count / elapsed
                 self._fps_frame_count = 0
                 self._last_fps_time = now
+                # FPS etiketi sadece burada (saniyede bir) değişir -
+                # patch'i şimdi rasterize et ki stream tarafı her zaman
+                # cache isabetiyle sadece blit yapsın
+                if CV2_AVAILABLE:
+                    _render_text(f"FPS: {self._fps:.1f}", (0, 255, 0))
             
             return frame
             
         except Exception as e:
-            self._logger.error(f"Frame yakalama hatası: {e}")
+            self._logger.error("Frame yakalama hatası: %s", e)
             return None
     
     # =========================================================================
     # LASER DETECTION
     # =========================================================================
     
-    def detect_laser(self, frame: np.ndarray) -> Tuple[Optional[Tuple[int, int]], np.ndarray]:
+    def detect_laser(self, frame: np.ndarray) -> Optional[Tuple[int, int]]:
         """
         Frame içinde lazer noktasını tespit et.
         
         Algoritma:
-        1. Grayscale'e çevir
-        2. Threshold uygula (lazer çok parlak)
-        3. Kontur bul
+        1. minMaxLoc ile ucuz red (eşiği geçen piksel yoksa erken çık)
+        2. Çeyrek çözünürlükte kaba arama (gevşek threshold + CC)
+        3. Bulunan ROI'lerde tam çözünürlük rafine (kesin threshold + CC)
         4. Alan ve dairesellik filtrele
         5. En iyi adayı seç
-        
+
         Args:
-            frame: BGR formatında input frame
-        
+            frame: Grayscale (tek kanal) input frame
+
         Returns:
-            Tuple[position, processed_frame]:
-                - position: (x, y) lazer merkezi veya None
-                - processed_frame: Görselleştirilmiş frame
+            Optional[Tuple[int, int]]: (x, y) lazer merkezi veya None
+
+        Note:
+            Görselleştirme hot path'te yapılmaz; overlay'li frame
+            get_processed_frame() ile stream hızında üretilir.
         """
         if frame is None:
-            return (None, None)
-        
-        # Orijinal frame'in kopyası (görselleştirme için)
-        display_frame = frame.copy()
-        
-        # ---------------------------------------------------------------------
-        # 1. GRAYSCALE'E ÇEVİR
-        # ---------------------------------------------------------------------
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        
+            return None
+
         # ---------------------------------------------------------------------
-        # 2. THRESHOLD UYGULA
+        # 1. GRAYSCALE GİRİŞ
         # ---------------------------------------------------------------------
-        _, binary = cv2.threshold(gray, self.threshold, 255, cv2.THRESH_BINARY)
-        
+        # capture_frame zaten Y düzlemi / grayscale döndürür - dönüşüm yok.
+        # Harici BGR frame gelirse (test path) kırmızı kanalı kullan:
+        # 940nm için tek kanal, cvtColor ağırlıklı toplamıyla eşdeğer bilgi
+        if frame.ndim == 3:
+            frame = frame[:, :, 2]
+        gray = frame
+
+        # OpenCV'nin threshold/morfoloji kernel'leri yalnızca CV_8UC1
+        # contiguous girişte SIMD hızlı yoluna girer - debug modunda ilk
+        # frame'de gizli kopya/dtype sapması olmadığını bir kez doğrula.
+        # (THRESH_OTSU sadece kalibrasyonda kullanılmalı; sabit eşik dalı
+        # Pi 5'te NEON kernel'ine düşer)
+        if not self._input_checked:
+            assert gray.dtype == np.uint8, f"beklenmeyen dtype: {gray.dtype}"
+            assert gray.flags.c_contiguous, "frame C-contiguous değil"
+            self._logger.debug("Giriş formatı doğrulandı: uint8, contiguous")
+            self._input_checked = True
+
         # ---------------------------------------------------------------------
-        # 3. GÜRÜLTÜ AZALTMA
+        # 2. UCUZ RED (minMaxLoc)
         # ---------------------------------------------------------------------
-        kernel = np.ones((3, 3), np.uint8)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel)
-        
+        # Lazer kapalı/gizlenmişse hiçbir piksel eşiği geçmez - threshold +
+        # morfoloji + CC koşturmak boşa. minMaxLoc tek SIMD geçişidir;
+        # pahalı adıma girmeden önce ucuzca reddet
+        _, max_val, _, _ = cv2.minMaxLoc(gray)
+        if max_val < self.threshold:
+            with self._frame_lock:
+                old_raw = self._last_raw
+                self._last_raw = frame
+                self._last_candidates = self._cand[:0]
+                self._last_best = -1
+            self._new_result_event.set()
+            self._release_raw(old_raw, frame)
+            return None
+
         # ---------------------------------------------------------------------
-        # 4. KONTUR BUL
+        # 3. KABA ARAMA (çeyrek çözünürlük)
         # ---------------------------------------------------------------------
-        contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, 
-                                       cv2.CHAIN_APPROX_SIMPLE)
-        
+        # Lazer ≤500px² - frame'in çoğu siyah. Tüm pipeline'ı tam çözünürlükte
+        # koşturmak yerine çeyrek çözünürlükte aday ROI'ler bulunur; threshold
+        # ve component analizi sadece bu ROI'lerde tam çözünürlükle tekrarlanır
+        # İki zincirli pyrDown = çeyrek çözünürlük. pyrDown'un ayrılabilir
+        # 5x5 Gauss kernel'i SIMD optimize edilmiştir ve tek geçişli
+        # INTER_AREA resize'dan daha ucuzdur.
+        # Not: Bu aşama G-API ile tek graf halinde fuse edilebilirdi, ama
+        # graf derlenirken threshold sabitlenir (çalışma anında web
+        # arayüzünden değiştirilebiliyor) ve tam kare DRAM geçişleri
+        # zaten çeyrek çözünürlüğe indirildi - kazanç kalmıyor
+        half = cv2.pyrDown(gray, dst=self._half_buf)
+        small = cv2.pyrDown(half, dst=self._small_buf)
+
+        # Gauss ortalaması küçük parlak noktayı soluklaştırır -
+        # kaba geçişte eşik gevşek tutulur, kesin eşik ROI'de uygulanır
+        coarse_thr = max(16, self.threshold // 4)
+        _, small_bin = cv2.threshold(small, coarse_thr, 255, cv2.THRESH_BINARY,
+                                     dst=self._small_bin_buf)
+
+        n_coarse, _, coarse_stats, _ = cv2.connectedComponentsWithStatsWithAlgorithm(
+            small_bin, 8, cv2.CV_32S, cv2.CCL_BBDT)
+
         # ---------------------------------------------------------------------
-        # 5. ADAY FİLTRELEME
+        # 4. ROI RAFİNE (tam çözünürlük, sadece blob çevresi)
         # ---------------------------------------------------------------------
-        candidates = []
-        
-        for contour in contours:
-            # Alan hesapla
-            area = cv2.contourArea(contour)
-            
-            # Alan filtresi
-            if area < self.min_area or area > self.max_area:
-                continue
-            
-            # Dairesellik hesapla
-            perimeter = cv2.arcLength(contour, True)
-            if perimeter == 0:
-                continue
-            
-            circularity = 4 * np.pi * area / (perimeter * perimeter)
-            
-            # Dairesellik filtresi
-            if circularity < self.circularity_min:
-                continue
-            
-            # Centroid hesapla
-            M = cv2.moments(contour)
-            if M["m00"] == 0:
+        cand = self._cand
+        n_cand = 0
+        patches: List[np.ndarray] = []  # çevre rafinesi için ikili kesitler
+        inv_scale = int(round(1.0 / _COARSE_SCALE))
+        frame_h, frame_w = gray.shape
+
+        # En fazla 8 kaba ROI işle (arka plan label 0 hariç)
+        for coarse_label in range(1, min(n_coarse, 9)):
+            x, y, w, h, area = coarse_stats[coarse_label]
+
+            # Aşırı büyük ışık kaynakları lazer değil - ROI'yi hiç açma
+            if area * inv_scale * inv_scale > self.max_area * 4:
                 continue
-            
-            cx = int(M["m10"] / M["m00"])
-            cy = int(M["m01"] / M["m00"])
-            
-            # Bounding box
-            x, y, w, h = cv2.boundingRect(contour)
-            
-            # Adayı kaydet
-            candidates.append({
-                'center': (cx, cy),
-                'area': area,
-                'circularity': circularity,
-                'bbox': (x, y, w, h),
-                'contour': contour
-            })
-        
+
+            # Kaba bbox'ı tam çözünürlüğe ölçekle + kenar payı
+            x0 = max(0, x * inv_scale - _ROI_MARGIN)
+            y0 = max(0, y * inv_scale - _ROI_MARGIN)
+            x1 = min(frame_w, (x + w) * inv_scale + _ROI_MARGIN)
+            y1 = min(frame_h, (y + h) * inv_scale + _ROI_MARGIN)
+
+            roi = gray[y0:y1, x0:x1]
+
+            if NUMBA_AVAILABLE:
+                # Tek geçişli JIT tarama: ara ikili görüntü, morfoloji ve
+                # genel amaçlı CCL yok - momentler tarama sırasında birikir
+                n_blobs, stats, centroids = _scan_blobs(roi, self.threshold)
+                if n_blobs == 0:
+                    continue
+                stats = stats[:n_blobs]
+                centroids = centroids[:n_blobs]
+                roi_bin = None
+            else:
+                # Kesin threshold + gürültü azaltma sadece ROI üzerinde
+                _, roi_bin = cv2.threshold(roi, self.threshold, 255,
+                                           cv2.THRESH_BINARY)
+                roi_bin = cv2.morphologyEx(roi_bin, cv2.MORPH_OPEN,
+                                           _MORPH_KERNEL)
+
+                n_labels, _, stats, centroids = \
+                    cv2.connectedComponentsWithStatsWithAlgorithm(
+                        roi_bin, 8, cv2.CV_32S, cv2.CCL_BBDT)
+
+                if n_labels <= 1:
+                    continue
+                # Arka plan etiketini (0) at
+                stats = stats[1:]
+                centroids = centroids[1:]
+
+            # Alan filtresi (vektörize)
+            areas = stats[:, cv2.CC_STAT_AREA]
+            area_mask = (areas >= self.min_area) & (areas <= self.max_area)
+
+            # Dairesellik kapısı bölmesiz: circ = 4·area / (π·d²) < min_c
+            # yerine 4·area < (min_c·π)·d² karşılaştırılır. Bölme yalnızca
+            # kapıyı geçen (az sayıda) aday için sıralama değeri üretirken
+            # yapılır
+            circ_gate = self.circularity_min * np.pi
+
+            for label in np.flatnonzero(area_mask):
+                if n_cand >= _MAX_CANDIDATES:
+                    break
+                bx, by, bw, bh, barea = stats[label]
+
+                # Dairesellik tahmini (arcLength olmadan, stats'tan):
+                # 4π·area / (π·max(w,h))² = 4·area / (π·max(w,h)²)
+                d = bw if bw > bh else bh
+                dd = d * d
+
+                # Dairesellik filtresi (bölmesiz karşılaştırma)
+                if 4.0 * barea < circ_gate * dd:
+                    continue
+
+                circularity = 4.0 * barea / (np.pi * dd)
+
+                # Centroid: ROI-yerel → global koordinat
+                cx = x0 + int(centroids[label][0])
+                cy = y0 + int(centroids[label][1])
+
+                # Adayı SoA buffer'ına yaz (dict/GC yok). Numba yolunda
+                # ikili kesit yok - gerekirse seçim aşamasında üretilir
+                cand[n_cand] = (cx, cy, barea, circularity,
+                                x0 + int(bx), y0 + int(by), int(bw), int(bh))
+                patches.append(roi_bin[by:by + bh, bx:bx + bw]
+                               if roi_bin is not None else None)
+                n_cand += 1
+
         # ---------------------------------------------------------------------
-        # 6. EN İYİ ADAYI SEÇ
+        # 5. EN İYİ ADAYI SEÇ
         # ---------------------------------------------------------------------
         laser_pos = None
-        best_candidate = None
-        
-        if candidates:
-            candidates.sort(key=lambda c: c['circularity'], reverse=True)
-            best_candidate = candidates[0]
-            laser_pos = best_candidate['center']
-            self._detection_count += 1
-        
+        best_idx = -1
+        view = cand[:n_cand]
+
+        if n_cand:
+            # Gerçek çevre (arcLength) sadece en iyi 5 survivor için:
+            # blob'un ikili kesitinde kontur bulup tahmini daireselliği
+            # düzelt. Sıralama NumPy argsort ile - Python sort/dict yok
+            order = np.argsort(view['circ'])[::-1]
+            for i in order[:5]:
+                patch = patches[i]
+                if patch is None:
+                    # Numba yolunda ikili kesit üretilmedi - sadece bu
+                    # survivor'ın bbox'ı yeniden eşiklenir (≤ ~23x23 px)
+                    bx0, by0 = view['bx'][i], view['by'][i]
+                    _, patch = cv2.threshold(
+                        gray[by0:by0 + view['bh'][i],
+                             bx0:bx0 + view['bw'][i]],
+                        self.threshold, 255, cv2.THRESH_BINARY)
+                contours, _ = cv2.findContours(patch,
+                                               cv2.RETR_EXTERNAL,
+                                               cv2.CHAIN_APPROX_SIMPLE)
+                if contours:
+                    perimeter = cv2.arcLength(contours[0], True)
+                    if perimeter > 0:
+                        view['circ'][i] = (4 * np.pi * view['area'][i]
+                                           / (perimeter * perimeter))
+
+            best_idx = int(view['circ'].argmax())
+
+            if view['circ'][best_idx] >= self.circularity_min:
+                laser_pos = (int(view['cx'][best_idx]),
+                             int(view['cy'][best_idx]))
+                self._detection_count += 1
+            else:
+                best_idx = -1
+
         # ---------------------------------------------------------------------
-        # 7. GÖRSELLEŞTİRME
+        # 6. SONUCU YAYINLA
         # ---------------------------------------------------------------------
-        center_x = self.resolution[0] // 2
-        center_y = self.resolution[1] // 2
-        
-        # Merkez çarpı işareti
-        cv2.line(display_frame, (center_x - 20, center_y), 
-                (center_x + 20, center_y), (0, 255, 0), 2)
-        cv2.line(display_frame, (center_x, center_y - 20), 
-                (center_x, center_y + 20), (0, 255, 0), 2)
-        
-        # Deadzone çemberi
-        cv2.circle(display_frame, (center_x, center_y), 
-                  DEADZONE_PIXELS, (0, 255, 0), 1)
-        
-        # Tüm adayları çiz (gri)
-        for candidate in candidates:
-            cx, cy = candidate['center']
-            cv2.circle(display_frame, (cx, cy), 5, (128, 128, 128), 1)
-        
-        # En iyi adayı vurgula (kırmızı)
-        if best_candidate:
-            cx, cy = best_candidate['center']
-            x, y, w, h = best_candidate['bbox']
-            
-            cv2.rectangle(display_frame, (x, y), (x + w, y + h), (0, 0, 255), 2)
-            cv2.circle(display_frame, (cx, cy), 8, (0, 0, 255), -1)
-            cv2.line(display_frame, (center_x, center_y), (cx, cy), (0, 0, 255), 2)
-            
-            error_x = cx - center_x
-            error_y = cy - center_y
-            cv2.putText(display_frame, f"dX:{error_x} dY:{error_y}", 
-                       (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
-        
-        # FPS göster
-        cv2.putText(display_frame, f"FPS: {self._fps:.1f}", 
-                   (10, self.resolution[1] - 10), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 2)
-        
-        # Threshold göster
-        cv2.putText(display_frame, f"Thresh: {self.threshold}", 
-                   (self.resolution[0] - 120, 30), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 0), 2)
-        
-        # İşlenmiş frame'i sakla
+        # Hot path'te çizim yok. Aday array'i bir sonraki frame'de yeniden
+        # doldurulacağı için küçük bir kopyası yayınlanır (dict listesinden
+        # çok daha ucuz, tek blok bellek)
         with self._frame_lock:
-            self._processed_frame = display_frame.copy()
-        
-        return (laser_pos, display_frame)
+            old_raw = self._last_raw
+            self._last_raw = frame
+            self._last_candidates = view.copy()
+            self._last_best = best_idx
+        self._new_result_event.set()
+        self._release_raw(old_raw, frame)
+
+        return laser_pos
     
     # =========================================================================
     # UTILITY METHODS
@@ -417,12 +918,99 @@ class LaserDetector:
         self.max_area = max(self.min_area + 1, max_area)
         self._logger.info(f"Alan limitleri güncellendi: {self.min_area}-{self.max_area}")
     
+    def wait_for_new_result(self, timeout: Optional[float] = None) -> bool:
+        """
+        Yeni bir tespit sonucu yayınlanana kadar bekle.
+
+        Web stream generator'ı sabit aralıkla polling yapmak yerine
+        bunu çağırır - yeni frame yoksa uyur, tespit thread'i jitter
+        görmez.
+
+        Returns:
+            bool: Yeni sonuç geldi ise True, timeout ise False
+        """
+        got = self._new_result_event.wait(timeout)
+        if got:
+            self._new_result_event.clear()
+        return got
+
     def get_processed_frame(self) -> Optional[np.ndarray]:
-        """Son işlenmiş frame'i al."""
+        """
+        Overlay'li frame üret (web stream için).
+
+        Tespit hot path'i çizim/kopya yapmaz; ham frame ve son tespit
+        sonucu burada, stream hızında (VIDEO_STREAM_FPS) BGR'ye çevrilip
+        işaretlenir - 60Hz kontrol döngüsünde değil.
+        """
+        # Grayscale → BGR dönüşümü KİLİT ALTINDA yapılır: kilit
+        # bırakılınca raw buffer'ı tespit thread'i havuza döndürüp
+        # üzerine yazabilir - ref dışarı taşınırsa yırtık frame.
+        # Dönüşüm ~1ms ve stream hızında koşar; yayın tarafını ancak o
+        # kadar bekletir. Önceden ayrılmış buffer'a çevrilir; test
+        # path'inden farklı boyutta frame gelirse normal ayırma yoluna
+        # düşülür
         with self._frame_lock:
-            if self._processed_frame is not None:
-                return self._processed_frame.copy()
-        return None
+            raw = self._last_raw
+            candidates = self._last_candidates
+            best_idx = self._last_best
+
+            if raw is None:
+                return None
+
+            if raw.shape[:2] == self._proc_bufs[0].shape[:2]:
+                display_frame = cv2.cvtColor(
+                    raw, cv2.COLOR_GRAY2BGR,
+                    dst=self._proc_bufs[self._proc_buf_idx])
+                self._proc_buf_idx ^= 1
+            else:
+                display_frame = cv2.cvtColor(raw, cv2.COLOR_GRAY2BGR)
+
+        center_x = self.resolution[0] // 2
+        center_y = self.resolution[1] // 2
+
+        # Merkez çarpı işareti
+        cv2.line(display_frame, (center_x - 20, center_y),
+                (center_x + 20, center_y), (0, 255, 0), 2)
+        cv2.line(display_frame, (center_x, center_y - 20),
+                (center_x, center_y + 20), (0, 255, 0), 2)
+
+        # Deadzone çemberi
+        cv2.circle(display_frame, (center_x, center_y),
+                  DEADZONE_PIXELS, (0, 255, 0), 1)
+
+        # Tüm adayları çiz (gri)
+        if candidates is not None:
+            for candidate in candidates:
+                cv2.circle(display_frame,
+                           (int(candidate['cx']), int(candidate['cy'])),
+                           5, (128, 128, 128), 1)
+
+        # En iyi adayı vurgula (kırmızı)
+        if best_idx >= 0:
+            best = candidates[best_idx]
+            cx, cy = int(best['cx']), int(best['cy'])
+            x, y, w, h = (int(best['bx']), int(best['by']),
+                          int(best['bw']), int(best['bh']))
+
+            cv2.rectangle(display_frame, (x, y), (x + w, y + h), (0, 0, 255), 2)
+            cv2.circle(display_frame, (cx, cy), 8, (0, 0, 255), -1)
+            cv2.line(display_frame, (center_x, center_y), (cx, cy), (0, 0, 255), 2)
+
+            error_x = cx - center_x
+            error_y = cy - center_y
+            cv2.putText(display_frame, f"dX:{error_x} dY:{error_y}",
+                       (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+
+        # FPS göster - 1 ondalığa yuvarlanmış string cache'de yüksek
+        # isabet oranı yakalar, glyph'ler her frame'de yeniden çizilmez
+        _blit_text(display_frame, f"FPS: {self._fps:.1f}",
+                   (10, self.resolution[1] - 10), (0, 255, 0))
+
+        # Threshold göster
+        _blit_text(display_frame, f"Thresh: {self.threshold}",
+                   (self.resolution[0] - 120, 30), (255, 255, 0))
+
+        return display_frame
     
     def get_statistics(self) -> dict:
         """İstatistikleri döndür."""
@@ -443,6 +1031,74 @@ class LaserDetector:
 # KALMAN FILTER
 # =============================================================================
 
+def _kalman_update(state, P, z, Q, R):
+    """
+    Kalman predict + update adımı (serbest fonksiyon).
+
+    4x4 / 2x4 sabit boyutlu matrisler için NumPy dispatch maliyeti
+    aritmetiğin kendisinden büyük - bu yüzden tek fonksiyonda toplanıp
+    Numba varsa JIT derlenir. 2x2 innovation matrisinin tersi kapalı
+    formda (1/det çarpanı) alınır; np.linalg.inv çağrısı yok.
+
+    Sabit hız modelinde F yalnızca 6 sıfırdışı eleman içerir; F·state ve
+    F·P·Fᵀ sembolik olarak açılmıştır - iki tam 4x4 matmul yerine
+    indeks düzeyinde toplamalar yapılır.
+
+    H = [[1,0,0,0],[0,1,0,0]] bir seçici matristir: H·state = state[:2],
+    P·Hᵀ = P[:, :2], H·P·Hᵀ = P[:2, :2]. Bu yüzden H parametre olarak
+    alınmaz, ilgili matmul'lar dilimlemeyle değiştirilmiştir.
+
+    Returns:
+        Tuple[state, P]: Güncellenmiş durum ve kovaryans
+    """
+    # Predict: state' = F @ state → x += vx, y += vy
+    new_state = np.empty(4, dtype=np.float64)
+    new_state[0] = state[0] + state[2]
+    new_state[1] = state[1] + state[3]
+    new_state[2] = state[2]
+    new_state[3] = state[3]
+    state = new_state
+
+    # P' = F·P·Fᵀ + Q açılımı: pozisyon satır/sütunlarına (i<2, j<2)
+    # karşılık gelen hız bileşenleri eklenir
+    new_P = np.empty((4, 4), dtype=np.float64)
+    for i in range(4):
+        for j in range(4):
+            v = P[i, j]
+            if i < 2:
+                v += P[i + 2, j]
+            if j < 2:
+                v += P[i, j + 2]
+            if i < 2 and j < 2:
+                v += P[i + 2, j + 2]
+            new_P[i, j] = v + Q[i, j]
+    P = new_P
+
+    # Innovation: H·P·Hᵀ = P[:2, :2]
+    S = P[:2, :2] + R
+
+    # 2x2 kapalı form ters: inv([[a,b],[c,d]]) = 1/det * [[d,-b],[-c,a]]
+    det = S[0, 0] * S[1, 1] - S[0, 1] * S[1, 0]
+    inv_S = np.empty((2, 2), dtype=np.float64)
+    inv_S[0, 0] = S[1, 1] / det
+    inv_S[0, 1] = -S[0, 1] / det
+    inv_S[1, 0] = -S[1, 0] / det
+    inv_S[1, 1] = S[0, 0] / det
+
+    # Kalman kazancı ve düzeltme: P·Hᵀ = P[:, :2], H·state = state[:2]
+    K = np.ascontiguousarray(P[:, :2]) @ inv_S
+    y = z - state[:2]
+    state = state + K @ y
+    # (I - K·H)·P = P - K·(H·P) = P - K·P[:2, :]
+    P = P - K @ np.ascontiguousarray(P[:2, :])
+
+    return state, P
+
+
+if NUMBA_AVAILABLE:
+    _kalman_update = njit(cache=True, fastmath=True)(_kalman_update)
+
+
 class KalmanTracker:
     """
     Lazer pozisyonu için Kalman filtresi.
@@ -478,6 +1134,8 @@ class KalmanTracker:
         ], dtype=np.float64)
         
         # Ölçüm matrisi (sadece x, y ölçüyoruz)
+        # Not: _kalman_update H'yi kullanmaz - seçici yapı dilimlemeyle
+        # ifade edilir; H burada modelin dokümantasyonu olarak durur
         self.H = np.array([
             [1, 0, 0, 0],
             [0, 1, 0, 0]
@@ -499,32 +1157,63 @@ class KalmanTracker:
         return (self.state[0], self.state[1])
     
     def update(self, measurement: Tuple[float, float]) -> Tuple[float, float]:
-        """Ölçümle durumu güncelle."""
+        """Ölçümle durumu güncelle (predict + correct tek kernel'de)."""
         if not self._initialized:
             self.state[0] = measurement[0]
             self.state[1] = measurement[1]
             self._initialized = True
             return measurement
-        
-        self.predict()
-        
-        z = np.array(measurement)
-        S = self.H @ self.P @ self.H.T + self.R
-        K = self.P @ self.H.T @ np.linalg.inv(S)
-        y = z - self.H @ self.state
-        self.state = self.state + K @ y
-        I = np.eye(4)
-        self.P = (I - K @ self.H) @ self.P
-        
+
+        z = np.array(measurement, dtype=np.float64)
+        self.state, self.P = _kalman_update(self.state, self.P, z,
+                                            self.Q, self.R)
+
         return (self.state[0], self.state[1])
     
     def reset(self):
-        """Filtreyi sıfırla."""
-        self.state = np.zeros(4)
-        self.P = np.eye(4) * 1000
+        """
+        Filtreyi sıfırla.
+
+        LASER_LOST_TIMEOUT sonrası hızlı yeniden yakalama senaryosunda
+        sık çağrılır - yeni array ayırmak yerine mevcut buffer'lar
+        yerinde doldurulur (bellek L1'de sıcak kalır).
+        """
+        self.state.fill(0.0)
+        self.P.fill(0.0)
+        np.fill_diagonal(self.P, 1000.0)
         self._initialized = False
 
 
+# =============================================================================
+# JIT WARMUP
+# =============================================================================
+
+def warmup_jit():
+    """
+    Numba kernel'lerini küçük dummy girdilerle önceden derle.
+
+    njit(cache=True) derlenmiş kodu diske yazar ama ilk çağrı yine de
+    yükleme/derleme duraklaması (soğuk başlangıçta yüzlerce ms) yaşar.
+    Thread'ler başlamadan burada tetiklenirse ilk gerçek frame tespit
+    bütçesinin içinde kalır.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+
+    # Blob taraması: eşiği geçen tek piksellik dummy ROI yeterli
+    dummy_roi = np.zeros((4, 4), np.uint8)
+    dummy_roi[1, 1] = 255
+    _scan_blobs(dummy_roi, 200)
+
+    # Kalman predict+update adımı
+    state = np.zeros(4, np.float64)
+    P = np.eye(4, dtype=np.float64)
+    z = np.zeros(2, np.float64)
+    Q = np.eye(4, dtype=np.float64) * 0.01
+    R = np.eye(2, dtype=np.float64) * 10.0
+    _kalman_update(state, P, z, Q, R)
+
+
 # =============================================================================
 # TEST
 # =============================================================================
@@ -547,16 +1236,18 @@ if __name__ == '__main__':
         print("\n📷 Test başlıyor (ESC ile çık)...")
         
         while True:
-            frame = detector.capture_frame()
+            frame = detector.get_latest_frame()
             if frame is None:
                 continue
             
-            pos, processed = detector.detect_laser(frame)
-            
+            pos = detector.detect_laser(frame)
+
             if pos:
                 print(f"🔴 Lazer: X={pos[0]}, Y={pos[1]}")
-            
-            cv2.imshow('Laser Detection', processed)
+
+            processed = detector.get_processed_frame()
+            if processed is not None:
+                cv2.imshow('Laser Detection', processed)
             
             if cv2.waitKey(1) & 0xFF == 27:
                 break
@@ -35,19 +35,71 @@ Version: 1.0.0
 # =============================================================================
 # IMPORTS
 # =============================================================================
+import os
+import math
 import time
+import queue
+import struct
 import threading
 import logging
 import socket
-from collections import deque
+from collections import deque, namedtuple
+
+# OpenCV - JPEG encode için (opsiyonel; tespit zaten laser_detector'da)
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+    logging.warning("OpenCV kurulu değil!")
 
 # Flask - Web arayüzü için
 from flask import Flask, Response, request, jsonify
 
+# flask-sock - WebSocket telemetri push (opsiyonel)
+try:
+    from flask_sock import Sock
+    SOCK_AVAILABLE = True
+except ImportError:
+    SOCK_AVAILABLE = False
+    logging.info("flask-sock kurulu değil - telemetri /status polling ile")
+
+# TurboJPEG - libjpeg-turbo'nun SIMD (NEON) encode yolu (opsiyonel)
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    _turbo_jpeg = TurboJPEG()
+    TURBOJPEG_AVAILABLE = True
+except Exception:
+    _turbo_jpeg = None
+    TURBOJPEG_AVAILABLE = False
+    logging.info("PyTurboJPEG kurulu değil - cv2.imencode kullanılacak")
+
+# Numba (JIT derleme - opsiyonel)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Waitress - çok thread'li üretim WSGI sunucusu (opsiyonel)
+try:
+    from waitress import serve as waitress_serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+    logging.info("waitress kurulu değil - Flask dev sunucusu kullanılacak")
+
+# orjson - C uzantılı hızlı JSON serileştirme (opsiyonel)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Yerel modüller
 from config import *
 from msp_protocol import MSPProtocol
-from laser_detector import LaserDetector
+from laser_detector import LaserDetector, warmup_jit
 from pid_controller import PIDController
 from state_machine import StateMachine, SystemState
 
@@ -70,6 +122,18 @@ flask_log.setLevel(logging.ERROR)
 # =============================================================================
 app = Flask(__name__)
 
+# WS push yalnızca flask-sock'un desteklediği bir sunucu altında
+# açılır: waitress desteklenen listede yok (Werkzeug/Gunicorn/
+# Eventlet/Gevent) - handshake düşer ve istemciler sessizce polling'e
+# geri döner. Waitress varken /ws hiç kaydedilmez; istemci tarafı
+# zaten onerror/onclose ile /status polling'e düşüyor
+WS_ENABLED = SOCK_AVAILABLE and not WAITRESS_AVAILABLE
+if WS_ENABLED:
+    sock = Sock(app)
+elif SOCK_AVAILABLE:
+    logging.info("waitress altında WS desteklenmiyor - "
+                 "telemetri /status polling ile")
+
 # =============================================================================
 # GLOBAL INSTANCES
 # =============================================================================
@@ -80,41 +144,137 @@ pid_x: PIDController = None
 pid_y: PIDController = None
 state_machine: StateMachine = None
 
-# Thread-safe telemetri verisi
-telemetry_lock = threading.Lock()
-telemetry_data = {
-    'altitude': 0.0,
-    'armed': False,
-    'mode': 'UNKNOWN',
-    'laser_pos': None,
-    'laser_detected': False,
-    'system_state': 'IDLE',
-    'pid_output': (0, 0),
-    'rc_channels': [1500] * 8
-}
+# Telemetri: kilitsiz snapshot modeli. Her üretici kendi immutable
+# namedtuple'ını kurar ve tek elemanlı listeye atar - CPython'da referans
+# ataması GIL altında atomiktir, okuyucular kilit almadan her zaman
+# tutarlı bir bütün görür. 20Hz kontrol döngüsü ile Flask thread'leri
+# arasında hiçbir kilit çekişmesi kalmaz
+ControlTelemetry = namedtuple('ControlTelemetry',
+                              'laser_pos laser_detected system_state '
+                              'pid_output rc_channels')
+FcTelemetry = namedtuple('FcTelemetry', 'altitude armed mode')
+
+_control_telemetry = [ControlTelemetry(
+    laser_pos=None,
+    laser_detected=False,
+    system_state='IDLE',
+    pid_output=(0, 0),
+    rc_channels=(1500, 1500, 1500, 1500)
+)]
+_fc_telemetry = [FcTelemetry(altitude=0.0, armed=False, mode='UNKNOWN')]
+
+# Video stream: tek worker encode eder, istemciler hazır baytları bekler.
+# Condition (Event değil) kullanılır - birden çok generator'a aynı anda
+# güvenli broadcast gerekir
+_latest_jpeg: bytes = b''
+_jpeg_cond = threading.Condition()
+
+# /status cevabı üretici tarafında serileştirilir: kontrol döngüsü tick
+# başına bir kez JSON baytları üretir, kaç tarayıcı poll ederse etsin
+# istek başına json.dumps koşmaz
+_status_json = [b'{}']
+
+# WebSocket binary telemetri: snapshot değiştiğinde 27 baytlık sabit
+# format paket yayınlanır - HTTP çerçeveleme ve JSON parse yok, istemci
+# yalnızca bir şey değiştiğinde uyanır. Yayın deseni jpeg ile aynı:
+# Condition + paylaşılan son paket.
+# Format: altitude f32, armed u8, state u8, laser_detected u8,
+#         laser x/y i16, rc 4xu16, pid çıkışları 2xf32
+_WS_STRUCT = struct.Struct('<fBBBhh4H2f')
+_ws_frame = [b'']
+_ws_cond = threading.Condition()
+
+# Pipeline kademesi 2→3 arası sonuç kuyruğu: tespit thread'i
+# (laser_pos, zaman) koyar, kontrol döngüsü en tazesini alır.
+# maxsize=1 + drop-old → kontrol her zaman güncel sonucu görür
+_result_q: queue.Queue = queue.Queue(maxsize=1)
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
+# Normalizasyon sabitleri: error = pos * (2/RES) - 1 → döngü içinde
+# bölme ve tekrarlanan global erişim yok
+_INV_CX = 2.0 / CAMERA_RES_X
+_INV_CY = 2.0 / CAMERA_RES_Y
+
+
+def _outputs_to_rc(roll_out, pitch_out, throttle_out):
+    """
+    PID çıkışlarını (-1..+1) sınırlandırılmış RC değerlerine dönüştür.
+
+    Kontrol döngüsünün her tick'inde koşan saf aritmetik - numba varsa
+    JIT derlenir, RC_MIN/RC_MAX/RC_RANGE derleme anında sabitlenir.
+
+    Returns:
+        Tuple[int, int, int]: (rc_roll, rc_pitch, rc_throttle)
+    """
+    rc_roll = int(1500.0 + roll_out * RC_RANGE)
+    rc_pitch = int(1500.0 + pitch_out * RC_RANGE)
+    rc_throttle = int(1500.0 + throttle_out * RC_RANGE)
+
+    rc_roll = RC_MIN if rc_roll < RC_MIN else (
+        RC_MAX if rc_roll > RC_MAX else rc_roll)
+    rc_pitch = RC_MIN if rc_pitch < RC_MIN else (
+        RC_MAX if rc_pitch > RC_MAX else rc_pitch)
+    rc_throttle = RC_MIN if rc_throttle < RC_MIN else (
+        RC_MAX if rc_throttle > RC_MAX else rc_throttle)
+
+    return rc_roll, rc_pitch, rc_throttle
+
+
+if NUMBA_AVAILABLE:
+    _outputs_to_rc = njit(cache=True)(_outputs_to_rc)
+
+
+def _build_status() -> dict:
+    """Mevcut telemetri snapshot'larından /status sözlüğünü kur."""
+    ctrl = _control_telemetry[0]
+    fc = _fc_telemetry[0]
+    return {
+        'altitude': fc.altitude,
+        'armed': fc.armed,
+        'mode': fc.mode,
+        'laser_detected': ctrl.laser_detected,
+        'laser_pos': ctrl.laser_pos,
+        'state': ctrl.system_state,
+        'pid_output': ctrl.pid_output,
+        'rc_channels': ctrl.rc_channels,
+        'timestamp': time.time()
+    }
+
+
+# get_local_ip sonucu - UDP numarası ve kernel routing lookup'ı yalnızca
+# ilk çağrıda koşar
+_cached_ip = None
+
+
 def get_local_ip() -> str:
     """
-    Yerel IP adresini al.
-    
+    Yerel IP adresini al (ilk çağrıda belirlenir, sonrası cache'ten).
+
     Web arayüzüne erişim için kullanıcıya gösterilecek.
-    
+
     Returns:
         str: IP adresi (örn: '192.168.1.100')
     """
+    global _cached_ip
+    if _cached_ip is not None:
+        return _cached_ip
+
     try:
-        # UDP socket ile dış ağa bağlanmaya çalış (gerçekte bağlanmaz)
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(('8.8.8.8', 80))
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
+        # UDP socket ile dış ağa bağlanmaya çalış (gerçekte bağlanmaz);
+        # with bloğu socket'in deterministik kapanmasını garanti eder
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(('8.8.8.8', 80))
+            _cached_ip = s.getsockname()[0]
     except Exception:
-        return '127.0.0.1'
+        try:
+            _cached_ip = socket.gethostbyname(socket.gethostname())
+        except Exception:
+            _cached_ip = '127.0.0.1'
+
+    return _cached_ip
 
 
 def print_banner():
@@ -142,32 +302,30 @@ def print_banner():
     print("=" * 70)
 
 
+# Piksel/metre referans tablosu: satırlar derleme anı kamera sabitlerine
+# bağlıdır - trig bir kez import sırasında koşar, print sadece formatlar.
+# Satır: (yükseklik m, yer genişliği m, piksel/metre, 2cm lazer çapı px)
+PPM_TABLE = tuple(
+    (alt, gw, CAMERA_RES_X / gw, 0.02 * CAMERA_RES_X / gw)
+    for alt, gw in (
+        (alt, 2 * alt * math.tan(math.radians(CAMERA_FOV_H) / 2))
+        for alt in (1, 2, 5, 10, 15, 20)))
+
+
 def print_ppm_table():
     """
     Yüksekliğe göre piksel/metre tablosunu yazdır.
-    
-    Lazer tespiti için referans değerler.
+
+    Lazer tespiti için referans değerler (PPM_TABLE'dan).
     """
-    import math
-    
     print("\n📊 Piksel/Metre Referans Tablosu:")
     print("-" * 50)
     print(f"{'Yükseklik':>10} | {'Yer Genişliği':>12} | {'PPM':>10} | {'Lazer':>8}")
     print("-" * 50)
-    
-    for alt in [1, 2, 5, 10, 15, 20]:
-        # FOV'dan yer genişliği hesapla
-        fov_rad = math.radians(CAMERA_FOV_H)
-        ground_width = 2 * alt * math.tan(fov_rad / 2)
-        
-        # Piksel/metre oranı
-        ppm = CAMERA_RES_X / ground_width
-        
-        # 2cm çaplı lazer noktası kaç piksel
-        laser_px = 0.02 * ppm
-        
+
+    for alt, ground_width, ppm, laser_px in PPM_TABLE:
         print(f"{alt:>8}m | {ground_width:>10.1f}m | {ppm:>8.1f} | {laser_px:>6.1f}px")
-    
+
     print("-" * 50)
 
 
@@ -175,55 +333,157 @@ def print_ppm_table():
 # MAIN CONTROL LOOP
 # =============================================================================
 
+def _send_none(rc_roll, rc_pitch, rc_throttle, rc_yaw):
+    """IDLE/COMPLETE: sistem pasif - komut gönderilmez."""
+    pass
+
+
+def _send_hover(rc_roll, rc_pitch, rc_throttle, rc_yaw):
+    """SEARCHING/LOST: önceden kurulmuş nötr hover frame'i."""
+    msp.send_rc_hover()
+
+
+def _send_rc(rc_roll, rc_pitch, rc_throttle, rc_yaw):
+    """TRACKING/APPROACH/LANDING: hesaplanmış RC değerlerini gönder."""
+    msp.send_rc_override(roll=rc_roll, pitch=rc_pitch,
+                         throttle=rc_throttle, yaw=rc_yaw)
+
+
+# Durum → komut işleyici tablosu: 5'e kadar elif karşılaştırması yerine
+# tek dict lookup'ı. Tablo bir kez kurulur, döngü gövdesi küçülür
+_STATE_HANDLERS = {
+    SystemState.IDLE: _send_none,
+    SystemState.SEARCHING: _send_hover,
+    SystemState.TRACKING: _send_rc,
+    SystemState.APPROACH: _send_rc,
+    SystemState.LANDING: _send_rc,
+    SystemState.LOST: _send_hover,
+    SystemState.COMPLETE: _send_none,
+}
+
+
+def detection_loop():
+    """
+    Tespit döngüsü (pipeline'ın 2. kademesi).
+
+    Yakalama thread'i frame N+1'i alırken burada frame N işlenir ve
+    kontrol döngüsü N-1'in sonucunu gönderir: uçtan uca gecikme
+    aşamaların toplamı değil en yavaş aşamanın süresi olur.
+    """
+    logger.info("Detection loop başlatıldı")
+
+    # Tespitin anlamsız olduğu durumlar: IDLE ve COMPLETE'te 60Hz piksel
+    # taraması boşa CPU yakar. LOST bilerek dahil DEĞİL - lazeri yeniden
+    # bulmak için tespitin koşmaya devam etmesi gerekir
+    _idle_states = (SystemState.IDLE, SystemState.COMPLETE)
+
+    while True:
+        try:
+            # Sistem pasifken tespiti atla (yakalama thread'i drop-old
+            # ile dönmeye devam eder - duruma girince taze frame hazır)
+            if state_machine.get_state() in _idle_states:
+                time.sleep(0.1)
+                continue
+
+            # Yeni frame'i bekle (her frame tam bir kez işlenir)
+            frame = detector.get_latest_frame(timeout=0.1)
+            if frame is None:
+                continue
+
+            laser_pos = detector.detect_laser(frame)
+            result = (laser_pos, time.monotonic())
+
+            # Drop-old: kontrol döngüsü her zaman en taze sonucu görür
+            try:
+                _result_q.put_nowait(result)
+            except queue.Full:
+                try:
+                    _result_q.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    _result_q.put_nowait(result)
+                except queue.Full:
+                    pass
+
+        except Exception as e:
+            logger.error("Detection loop hatası: %s", e)
+            time.sleep(0.1)
+
+
 def control_loop():
     """
-    Ana kontrol döngüsü.
-    
+    Ana kontrol döngüsü (pipeline'ın 3. kademesi).
+
     Bu fonksiyon ayrı bir thread'de çalışır ve şunları yapar:
-    1. Kameradan frame al
-    2. Lazer tespiti yap
-    3. State machine'i güncelle
-    4. PID hesapla
-    5. MSP RC komutları gönder
-    
+    1. En taze tespit sonucunu al (tespit ayrı kademede koşar)
+    2. State machine'i güncelle
+    3. PID hesapla
+    4. MSP RC komutları gönder
+
     Döngü hızı: MSP_SEND_RATE_HZ (varsayılan 20Hz = 50ms)
     """
-    global telemetry_data
-    
     logger.info("Control loop başlatıldı")
-    
-    # Döngü zamanlaması
+
+    # Kontrol thread'ini tek çekirdeğe sabitle: scheduler migration ve
+    # cache soğuması önlenir, 20Hz failsafe periyodu jitter'ı azalır
+    # (Pi 5'te 4 çekirdek var; 3 kontrol döngüsüne ayrılır)
+    try:
+        os.sched_setaffinity(0, {3})
+        logger.info("Control loop çekirdek 3'e sabitlendi")
+    except (AttributeError, OSError) as e:
+        logger.warning(f"CPU affinity ayarlanamadı: {e}")
+
+    # Döngü zamanlaması: mutlak deadline ile. Göreli sleep(period-elapsed)
+    # her turda drift biriktirir; monotonic saat üzerinde ilerleyen mutlak
+    # deadline hem drifti hem duvar saati sıçramalarını (NTP) eler
     loop_period = 1.0 / MSP_SEND_RATE_HZ  # 20Hz → 0.05s = 50ms
-    last_loop_time = time.time()
-    
+    next_deadline = time.monotonic()
+
     # PID reset için
     last_laser_time = 0
-    
+
+    # Son tespit sonucu (kuyruk boşsa önceki değer kullanılır)
+    result_pos = None
+    result_ts = 0.0
+
     while True:
         try:
-            loop_start = time.time()
-            
+
             # -----------------------------------------------------------------
-            # 1. KAMERADAN FRAME AL ve LAZER TESPİT ET
+            # 1. EN TAZE TESPİT SONUCUNU AL (tespit ayrı thread'de)
             # -----------------------------------------------------------------
-            frame = detector.capture_frame()
-            laser_pos, processed_frame = detector.detect_laser(frame)
-            
+            try:
+                result_pos, result_ts = _result_q.get_nowait()
+            except queue.Empty:
+                pass  # yeni sonuç henüz yok - önceki kullanılır
+
+            # Tick başına saat bir kez okunur; bayatlık kontrolü, FSM
+            # ve lazer zaman damgaları aynı değeri paylaşır
+            now_mono = time.monotonic()
+
+            # Bayat sonuç koruması: tespit kademesi takılırsa eski
+            # pozisyonu "görülüyor" diye bildirmeye devam etme
+            if result_ts and now_mono - result_ts < 0.2:
+                laser_pos = result_pos
+            else:
+                laser_pos = None
+
             # Lazer bulundu mu?
             laser_found = laser_pos is not None
             
             # -----------------------------------------------------------------
             # 2. STATE MACHINE GÜNCELLE
             # -----------------------------------------------------------------
-            # Telemetriden yükseklik al
-            with telemetry_lock:
-                current_alt = telemetry_data['altitude']
-            
+            # Telemetriden yükseklik al (kilitsiz snapshot okuma)
+            current_alt = _fc_telemetry[0].altitude
+
             # State machine'e bildir
             state_machine.update(
                 laser_detected=laser_found,
                 laser_position=laser_pos,
-                altitude=current_alt
+                altitude=current_alt,
+                now=now_mono
             )
             
             current_state = state_machine.get_state()
@@ -239,13 +499,10 @@ def control_loop():
                 if laser_found:
                     # Lazer pozisyonunu normalize et (-1 ile +1 arası)
                     # Ekran merkezi (0,0), sol üst (-1,-1), sağ alt (+1,+1)
-                    center_x = CAMERA_RES_X / 2
-                    center_y = CAMERA_RES_Y / 2
-                    
-                    # Hata hesapla (lazer merkeze ne kadar uzak)
-                    error_x = (laser_pos[0] - center_x) / center_x  # -1 to +1
-                    error_y = (laser_pos[1] - center_y) / center_y  # -1 to +1
-                    
+                    # Sabitler modül yüklenirken hesaplandı - bölme yok
+                    error_x = laser_pos[0] * _INV_CX - 1.0
+                    error_y = laser_pos[1] * _INV_CY - 1.0
+
                     # PID kontrolcülerden çıkış al
                     roll_output = pid_x.compute(error_x)    # Sola/sağa hareket
                     pitch_output = pid_y.compute(error_y)  # İleri/geri hareket
@@ -260,7 +517,7 @@ def control_loop():
                     else:
                         throttle_output = -MIN_DESCENT_SPEED  # Final iniş
                     
-                    last_laser_time = time.time()
+                    last_laser_time = now_mono
                 else:
                     # Lazer kayıp - eski değerleri kullanma, sıfırla
                     roll_output = 0
@@ -268,96 +525,137 @@ def control_loop():
                     throttle_output = 0
                     
                     # PID integrallerini sıfırla (wind-up önleme)
-                    if time.time() - last_laser_time > 0.5:
+                    if now_mono - last_laser_time > 0.5:
                         pid_x.reset()
                         pid_y.reset()
             
             # -----------------------------------------------------------------
             # 4. MSP RC KOMUTLARI GÖNDER
             # -----------------------------------------------------------------
-            if current_state == SystemState.IDLE:
-                # Sistem pasif - komut gönderme
-                pass
-            
-            elif current_state == SystemState.SEARCHING:
-                # Arama modu - hover (nötr değerler)
-                msp.send_rc_override(
-                    roll=1500,
-                    pitch=1500,
-                    throttle=1500,
-                    yaw=1500
-                )
-            
-            elif current_state in [SystemState.TRACKING, SystemState.APPROACH]:
-                # Lazer takibi - PID çıkışlarını RC değerlerine dönüştür
-                # RC değer aralığı: 1000-2000, merkez: 1500
-                # PID çıkışı: -1 ile +1 arası (normalized)
-                
-                rc_roll = int(1500 + roll_output * RC_RANGE)
-                rc_pitch = int(1500 + pitch_output * RC_RANGE)
-                rc_throttle = int(1500 + throttle_output * RC_RANGE)
-                rc_yaw = 1500  # Yaw değişmez
-                
-                # Limitleri uygula
-                rc_roll = max(RC_MIN, min(RC_MAX, rc_roll))
-                rc_pitch = max(RC_MIN, min(RC_MAX, rc_pitch))
-                rc_throttle = max(RC_MIN, min(RC_MAX, rc_throttle))
-                
-                msp.send_rc_override(
-                    roll=rc_roll,
-                    pitch=rc_pitch,
-                    throttle=rc_throttle,
-                    yaw=rc_yaw
-                )
-            
-            elif current_state == SystemState.LANDING:
-                # Final iniş - sadece yavaş alçal
-                msp.send_rc_override(
-                    roll=1500,
-                    pitch=1500,
-                    throttle=int(1500 - MIN_DESCENT_SPEED * RC_RANGE),
-                    yaw=1500
-                )
-            
-            elif current_state == SystemState.LOST:
-                # Lazer kayıp - hover moduna geç (LOITER)
-                msp.send_rc_override(
-                    roll=1500,
-                    pitch=1500,
-                    throttle=1500,
-                    yaw=1500
-                )
-            
+            # RC değerleri burada bir kez hesaplanır; telemetri aynı
+            # değerleri yeniden hesaplamadan kullanır.
+            # LANDING'de PID koşmaz ama sabit alçalma hızı uygulanır -
+            # RC dönüşümü tüm durumlar için tek noktadan geçer
+            if current_state == SystemState.LANDING:
+                throttle_output = -MIN_DESCENT_SPEED
+
+            # Durum tablosundan ilgili gönderim işleyicisi (tek lookup).
+            # RC dönüşümü yalnızca hesaplanmış değer gönderilecekse koşar -
+            # IDLE/SEARCHING/LOST/COMPLETE'te çıkışlar zaten nötrdür
+            handler = _STATE_HANDLERS[current_state]
+            if handler is _send_rc:
+                rc_roll, rc_pitch, rc_throttle = _outputs_to_rc(
+                    roll_output, pitch_output, throttle_output)
+            else:
+                rc_roll = rc_pitch = rc_throttle = 1500
+            rc_yaw = 1500  # Yaw değişmez
+
+            handler(rc_roll, rc_pitch, rc_throttle, rc_yaw)
+
             # -----------------------------------------------------------------
-            # 5. TELEMETRİ GÜNCELLE
+            # 5. TELEMETRİ GÜNCELLE (kilitsiz atomik snapshot yayını)
             # -----------------------------------------------------------------
-            with telemetry_lock:
-                telemetry_data['laser_pos'] = laser_pos
-                telemetry_data['laser_detected'] = laser_found
-                telemetry_data['system_state'] = current_state.name
-                telemetry_data['pid_output'] = (roll_output, pitch_output)
-                telemetry_data['rc_channels'] = [
-                    int(1500 + roll_output * RC_RANGE),
-                    int(1500 + pitch_output * RC_RANGE),
-                    int(1500 + throttle_output * RC_RANGE),
-                    1500
-                ]
-            
+            _control_telemetry[0] = ControlTelemetry(
+                laser_pos=laser_pos,
+                laser_detected=laser_found,
+                system_state=current_state.name,
+                pid_output=(roll_output, pitch_output),
+                rc_channels=(rc_roll, rc_pitch, rc_throttle, rc_yaw)
+            )
+
+            # /status baytlarını tick başına bir kez üret - HTTP tarafı
+            # istek başına serileştirme yapmaz
+            if ORJSON_AVAILABLE:
+                _status_json[0] = orjson.dumps(
+                    _build_status(), option=orjson.OPT_SERIALIZE_NUMPY)
+
+            # WebSocket istemcilerine binary snapshot - paket ancak
+            # bayt düzeyinde değiştiyse yayınlanır (WS kapalıysa pack
+            # dahil tüm iş atlanır)
+            if WS_ENABLED:
+                fc = _fc_telemetry[0]
+                lx, ly = laser_pos if laser_pos is not None else (-1, -1)
+                packed = _WS_STRUCT.pack(
+                    fc.altitude, fc.armed, current_state.value,
+                    laser_found, lx, ly,
+                    rc_roll, rc_pitch, rc_throttle, rc_yaw,
+                    roll_output, pitch_output)
+                if packed != _ws_frame[0]:
+                    with _ws_cond:
+                        _ws_frame[0] = packed
+                        _ws_cond.notify_all()
+
             # -----------------------------------------------------------------
-            # 6. DÖNGÜ ZAMANLAMASI
+            # 6. DÖNGÜ ZAMANLAMASI (mutlak deadline)
             # -----------------------------------------------------------------
-            loop_elapsed = time.time() - loop_start
-            sleep_time = loop_period - loop_elapsed
-            
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            next_deadline += loop_period
+            delay = next_deadline - time.monotonic()
+
+            if delay > 0:
+                time.sleep(delay)
             else:
-                # Döngü çok yavaş!
-                logger.warning(f"Control loop gecikmesi: {loop_elapsed*1000:.1f}ms "
-                             f"(hedef: {loop_period*1000:.1f}ms)")
-        
+                # Deadline kaçtı - kaçanları kovalamak yerine yeniden
+                # senkronize ol (burst göndermek failsafe'i daha çok bozar)
+                logger.warning("Control loop gecikmesi: %.1fms "
+                               "(periyot: %.1fms)",
+                               -delay * 1000, loop_period * 1000)
+                next_deadline = time.monotonic()
+
+        except Exception as e:
+            logger.error("Control loop hatası: %s", e)
+            time.sleep(0.1)
+            next_deadline = time.monotonic()
+
+
+def jpeg_worker():
+    """
+    Video stream JPEG encoder'ı (tek worker thread).
+
+    İşlenmiş frame'i stream hızında BİR kez encode eder; tüm bağlı
+    istemciler aynı buffer'ı paylaşır. Encode maliyeti istemci
+    sayısından bağımsız O(1) kalır ve kontrol thread'inden CPU çalmaz.
+    """
+    global _latest_jpeg
+
+    # OPTIMIZE=0: ikinci Huffman geçişi atlanır - stream için gereksiz
+    encode_params = [int(cv2.IMWRITE_JPEG_QUALITY), VIDEO_QUALITY,
+                     int(cv2.IMWRITE_JPEG_OPTIMIZE), 0]
+    period = 1.0 / VIDEO_STREAM_FPS
+    next_deadline = time.monotonic()
+
+    while True:
+        try:
+            # Yeni tespit sonucu bekle (sabit aralıklı polling yok)
+            if not detector.wait_for_new_result(timeout=1.0):
+                continue
+
+            frame = detector.get_processed_frame()
+            if frame is None:
+                continue
+
+            # TurboJPEG (NEON DCT/Huffman) varsa libjpeg'den ~3-5x hızlı
+            if TURBOJPEG_AVAILABLE:
+                data = _turbo_jpeg.encode(frame, quality=VIDEO_QUALITY,
+                                          pixel_format=TJPF_BGR)
+            else:
+                ok, buf = cv2.imencode('.jpg', frame, encode_params)
+                data = buf.tobytes() if ok else None
+
+            if data:
+                with _jpeg_cond:
+                    _latest_jpeg = data
+                    _jpeg_cond.notify_all()
+
+            # Tespit 60Hz döner, stream VIDEO_STREAM_FPS ile sınırlanır
+            next_deadline += period
+            delay = next_deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_deadline = time.monotonic()
+
         except Exception as e:
-            logger.error(f"Control loop hatası: {e}")
+            logger.error("JPEG worker hatası: %s", e)
             time.sleep(0.1)
 
 
@@ -371,30 +669,31 @@ def telemetry_loop():
     
     Döngü hızı: 10Hz
     """
-    global telemetry_data
-    
     logger.info("Telemetry loop başlatıldı")
-    
+
+    # Tick başına TEK UART alışverişi: yükseklik ve durum dönüşümlü
+    # sorgulanır (her biri 5Hz). İki ardışık bloklayan istek seri hattı
+    # 20Hz RC akışıyla iki kat fazla çekiştiriyordu
+    poll_altitude = True
+
     while True:
         try:
-            # FC'den yükseklik oku
-            altitude = msp.request_altitude()
-            
-            # FC'den durum oku
-            armed, mode = msp.request_status()
-            
-            # Thread-safe güncelle
-            with telemetry_lock:
+            prev = _fc_telemetry[0]
+
+            if poll_altitude:
+                altitude = msp.request_altitude()
                 if altitude is not None:
-                    telemetry_data['altitude'] = altitude
+                    _fc_telemetry[0] = prev._replace(altitude=altitude)
+            else:
+                armed, mode = msp.request_status()
                 if armed is not None:
-                    telemetry_data['armed'] = armed
-                    telemetry_data['mode'] = mode
-            
-            time.sleep(0.1)  # 10Hz
+                    _fc_telemetry[0] = prev._replace(armed=armed, mode=mode)
+
+            poll_altitude = not poll_altitude
+            time.sleep(0.1)  # 10Hz tick, kanal başına 5Hz
         
         except Exception as e:
-            logger.error(f"Telemetry loop hatası: {e}")
+            logger.error("Telemetry loop hatası: %s", e)
             time.sleep(0.5)
 
 
@@ -408,46 +707,53 @@ def index():
     return HTML_TEMPLATE
 
 
+# MJPEG part başlığı her frame'de aynıdır - bir kez kurulur
+_MJPEG_PART_HEADER = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
+
+
 @app.route('/video')
 def video_feed():
     """Video stream endpoint"""
     def generate():
+        # Encode işi jpeg_worker'da - burada sadece hazır buffer beklenir.
+        # Condition.wait() yeni frame yayınlanınca uyanır: polling
+        # gecikmesi yok, boşta istemci gereksiz uyanmaz
         while True:
             try:
-                # İşlenmiş frame'i al
-                frame = detector.get_processed_frame()
-                if frame is not None:
-                    # JPEG olarak encode et
-                    import cv2
-                    _, buffer = cv2.imencode('.jpg', frame, 
-                                            [cv2.IMWRITE_JPEG_QUALITY, 50])
-                    yield (b'--frame\r\n'
-                           b'Content-Type: image/jpeg\r\n\r\n' + 
-                           buffer.tobytes() + b'\r\n')
-                time.sleep(0.05)  # 20fps
+                with _jpeg_cond:
+                    if not _jpeg_cond.wait(timeout=1.0):
+                        continue
+                    data = _latest_jpeg
+
+                yield _MJPEG_PART_HEADER + data + b'\r\n'
             except Exception as e:
-                logger.error(f"Video stream hatası: {e}")
+                logger.error("Video stream hatası: %s", e)
                 time.sleep(0.1)
-    
-    return Response(generate(), 
+
+    return Response(generate(),
                    mimetype='multipart/x-mixed-replace; boundary=frame')
 
 
 @app.route('/status')
 def get_status():
     """Sistem durumu JSON endpoint"""
-    with telemetry_lock:
-        return jsonify({
-            'altitude': telemetry_data['altitude'],
-            'armed': telemetry_data['armed'],
-            'mode': telemetry_data['mode'],
-            'laser_detected': telemetry_data['laser_detected'],
-            'laser_pos': telemetry_data['laser_pos'],
-            'state': telemetry_data['system_state'],
-            'pid_output': telemetry_data['pid_output'],
-            'rc_channels': telemetry_data['rc_channels'],
-            'timestamp': time.time()
-        })
+    # Kontrol döngüsünün hazırladığı baytlar doğrudan döndürülür -
+    # istek başına ne kilit ne serileştirme var
+    if ORJSON_AVAILABLE:
+        return Response(_status_json[0], mimetype='application/json')
+    return jsonify(_build_status())
+
+
+if WS_ENABLED:
+    @sock.route('/ws')
+    def ws_telemetry(ws):
+        """Binary telemetri push - sadece snapshot değiştiğinde gönderir."""
+        while True:
+            with _ws_cond:
+                if not _ws_cond.wait(timeout=1.0):
+                    continue
+                data = _ws_frame[0]
+            ws.send(data)
 
 
 @app.route('/enable', methods=['POST'])
@@ -671,54 +977,86 @@ HTML_TEMPLATE = '''
             };
         });
         
-        // Status güncelleme
-        setInterval(() => {
-            fetch('/status')
-                .then(r => r.json())
-                .then(d => {
-                    // Altitude
-                    document.getElementById('altitude').textContent = 
-                        d.altitude.toFixed(1) + ' m';
-                    
-                    // Laser
-                    if (d.laser_detected && d.laser_pos) {
-                        document.getElementById('laser').textContent = 
-                            `X:${d.laser_pos[0]} Y:${d.laser_pos[1]}`;
-                    } else {
-                        document.getElementById('laser').textContent = '---';
-                    }
-                    
-                    // RC Channels
-                    const rc = d.rc_channels;
-                    document.getElementById('rc').innerHTML = 
-                        `R: ${rc[0]} | P: ${rc[1]}<br>T: ${rc[2]} | Y: ${rc[3]}`;
-                    
-                    // PID Output
-                    const pid = d.pid_output;
-                    document.getElementById('pid').textContent = 
-                        `X: ${pid[0].toFixed(2)} | Y: ${pid[1].toFixed(2)}`;
-                    
-                    // Status bar
-                    const status = document.getElementById('status');
-                    const state = d.state;
-                    status.className = 'status-bar status-' + state.toLowerCase();
-                    
-                    const stateText = {
-                        'IDLE': '⏸️ Sistem Pasif',
-                        'SEARCHING': '🔍 Lazer Aranıyor...',
-                        'TRACKING': '🔴 Lazer Takip Ediliyor',
-                        'APPROACH': '📍 Yaklaşma',
-                        'LANDING': '🛬 İniş Yapılıyor',
-                        'LOST': '⚠️ Lazer Kayıp!'
-                    };
-                    status.textContent = stateText[state] || state;
-                    status.textContent += ` | Alt: ${d.altitude.toFixed(1)}m`;
-                    
-                    // Enable button sync
-                    systemEnabled = (state !== 'IDLE');
-                    updateEnableBtn();
+        // Status güncelleme (JSON veya binary WS'den gelen aynı şekilli obje)
+        function updateUI(d) {
+            // Altitude
+            document.getElementById('altitude').textContent =
+                d.altitude.toFixed(1) + ' m';
+
+            // Laser
+            if (d.laser_detected && d.laser_pos) {
+                document.getElementById('laser').textContent =
+                    `X:${d.laser_pos[0]} Y:${d.laser_pos[1]}`;
+            } else {
+                document.getElementById('laser').textContent = '---';
+            }
+
+            // RC Channels
+            const rc = d.rc_channels;
+            document.getElementById('rc').innerHTML =
+                `R: ${rc[0]} | P: ${rc[1]}<br>T: ${rc[2]} | Y: ${rc[3]}`;
+
+            // PID Output
+            const pid = d.pid_output;
+            document.getElementById('pid').textContent =
+                `X: ${pid[0].toFixed(2)} | Y: ${pid[1].toFixed(2)}`;
+
+            // Status bar
+            const status = document.getElementById('status');
+            const state = d.state;
+            status.className = 'status-bar status-' + state.toLowerCase();
+
+            const stateText = {
+                'IDLE': '⏸️ Sistem Pasif',
+                'SEARCHING': '🔍 Lazer Aranıyor...',
+                'TRACKING': '🔴 Lazer Takip Ediliyor',
+                'APPROACH': '📍 Yaklaşma',
+                'LANDING': '🛬 İniş Yapılıyor',
+                'LOST': '⚠️ Lazer Kayıp!'
+            };
+            status.textContent = stateText[state] || state;
+            status.textContent += ` | Alt: ${d.altitude.toFixed(1)}m`;
+
+            // Enable button sync
+            systemEnabled = (state !== 'IDLE');
+            updateEnableBtn();
+        }
+
+        let pollTimer = null;
+        function startPolling() {
+            if (pollTimer) return;
+            pollTimer = setInterval(() => {
+                fetch('/status').then(r => r.json()).then(updateUI);
+            }, 200);
+        }
+
+        // Binary WebSocket telemetri: 27B sabit format, sadece bir şey
+        // değiştiğinde push edilir. Sunucuda flask-sock yoksa (veya WS
+        // düşerse) /status HTTP polling'e geri dönülür
+        const STATE_NAMES = [null, 'IDLE', 'SEARCHING', 'TRACKING',
+                             'APPROACH', 'LANDING', 'LOST', 'COMPLETE'];
+        try {
+            const ws = new WebSocket(`ws://${location.host}/ws`);
+            ws.binaryType = 'arraybuffer';
+            ws.onmessage = (ev) => {
+                const v = new DataView(ev.data);
+                const lx = v.getInt16(7, true), ly = v.getInt16(9, true);
+                updateUI({
+                    altitude: v.getFloat32(0, true),
+                    armed: !!v.getUint8(4),
+                    state: STATE_NAMES[v.getUint8(5)] || 'IDLE',
+                    laser_detected: !!v.getUint8(6),
+                    laser_pos: lx >= 0 ? [lx, ly] : null,
+                    rc_channels: [v.getUint16(11, true), v.getUint16(13, true),
+                                  v.getUint16(15, true), v.getUint16(17, true)],
+                    pid_output: [v.getFloat32(19, true), v.getFloat32(23, true)]
                 });
-        }, 200);
+            };
+            ws.onerror = startPolling;
+            ws.onclose = startPolling;
+        } catch (e) {
+            startPolling();
+        }
     </script>
 </body>
 </html>
@@ -813,7 +1151,41 @@ def main():
     # 5. THREAD'LERİ BAŞLAT
     # -------------------------------------------------------------------------
     logger.info("Thread'ler başlatılıyor...")
-    
+
+    # İlk kontrol tick'inden önce gelen /status istekleri boş '{}'
+    # yerine geçerli bir başlangıç snapshot'ı görsün
+    if ORJSON_AVAILABLE:
+        _status_json[0] = orjson.dumps(
+            _build_status(), option=orjson.OPT_SERIALIZE_NUMPY)
+
+    # Numba kernel'lerini thread'ler başlamadan ısıt - ilk kontrol tick'i
+    # ya da ilk frame derleme duraklamasına (yüzlerce ms) denk gelmesin
+    if NUMBA_AVAILABLE:
+        _outputs_to_rc(0.0, 0.0, 0.0)
+    warmup_jit()
+
+    # OpenCV'nin kendi thread havuzunu kapat: imencode/tespit çağrıları
+    # kontrol ve yakalama thread'leriyle çekirdek için yarışmasın
+    if CV2_AVAILABLE:
+        cv2.setNumThreads(1)
+
+    # Web sunucusu, tespit ve telemetri çekirdek 0-2'de kalır: affinity
+    # burada (thread'ler doğmadan) daraltılır ki waitress havuzu dahil
+    # tüm çocuk thread'ler bunu miras alsın. Kontrol döngüsü kendini
+    # çekirdek 3'e taşır - HTTP burst'leri 20Hz deadline'ı eritemez
+    try:
+        os.sched_setaffinity(0, {0, 1, 2})
+    except (AttributeError, OSError) as e:
+        logger.warning("CPU affinity daraltılamadı: %s", e)
+
+    # Detection loop thread (pipeline kademesi 2)
+    detection_thread = threading.Thread(
+        target=detection_loop,
+        daemon=True,
+        name="DetectionLoop"
+    )
+    detection_thread.start()
+
     # Control loop thread
     control_thread = threading.Thread(
         target=control_loop,
@@ -829,7 +1201,15 @@ def main():
         name="TelemetryLoop"
     )
     telemetry_thread.start()
-    
+
+    # JPEG encoder thread (video stream)
+    jpeg_thread = threading.Thread(
+        target=jpeg_worker,
+        daemon=True,
+        name="JpegWorker"
+    )
+    jpeg_thread.start()
+
     logger.info("✅ Thread'ler başlatıldı")
     
     # -------------------------------------------------------------------------
@@ -847,13 +1227,23 @@ def main():
     print("   5. RC kumanda her zaman elinizde olsun!")
     print("=" * 70 + "\n")
     
-    # Flask sunucusu başlat (blocking)
-    app.run(
-        host='0.0.0.0',
-        port=WEB_SERVER_PORT,
-        debug=False,
-        threaded=True
-    )
+    # Web sunucusu başlat (blocking). Waitress varsa o kullanılır -
+    # Werkzeug dev sunucusunun istek başına ek yükü yok, sabit thread
+    # havuzuyla çalışır. Havuz uzun ömürlü bağlantılara göre boyutlu:
+    # her açık panel bir /video MJPEG stream'ini süresiz tutar; 4
+    # thread'lik havuzu iki panel tüketir ve /enable - /disable gibi
+    # GÜVENLİK uçları erişilmez kalırdı. 16 thread ~8 panele kadar
+    # stream + kısa istekler için pay bırakır
+    if WAITRESS_AVAILABLE:
+        waitress_serve(app, host='0.0.0.0', port=WEB_SERVER_PORT,
+                       threads=16)
+    else:
+        app.run(
+            host='0.0.0.0',
+            port=WEB_SERVER_PORT,
+            debug=False,
+            threaded=True
+        )
 
 
 if __name__ == '__main__':
@@ -30,14 +30,29 @@ Kullanılan MSP Fonksiyonları:
 Referanslar:
   - INAV GitHub: github.com/iNavFlight/inav
   - MSP Protocol: github.com/iNavFlight/inav/wiki/MSP-V2
+
+Not (AOT derleme):
+  Modül tip-anotasyonlu ve ilkel int/bytes ağırlıklı yazıldığından
+  mypyc/Cython ile doğrudan derlenebilir; üretim kurulumunda
+  derlenmiş .so bu .py'yi gölgeler, geliştirmede .py olduğu gibi
+  import edilir. Depoda build altyapısı (setup.py) bulunmadığından
+  derleme adımı kurulum tarafına bırakılmıştır - sıcak yoldaki C
+  hızlandırma ihtiyacı şimdilik opsiyonel _msp_crc uzantısı ve numba
+  kernel'iyle karşılanır.
 ===============================================================================
 """
 
+import os
+import array
+import select
 import struct
+import itertools
 import time
 import logging
 import threading
-from typing import Optional, Tuple, Dict, List
+from typing import Optional, Tuple, Dict, List, Iterable
+
+import numpy as np
 
 # Serial port kütüphanesi
 try:
@@ -47,6 +62,23 @@ except ImportError:
     SERIAL_AVAILABLE = False
     logging.warning("pyserial kurulu değil! Simülasyon modunda çalışılacak.")
 
+# Numba (JIT derleme - opsiyonel): CRC döngüsü saf tamsayı işi,
+# derlenmiş kernel bayt başına interpreter vergisini tamamen kaldırır
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Opsiyonel C hızlandırıcı: sistemde derlenmiş bir _msp_crc uzantısı
+# (crc8_dvbs2(bytes) -> int) varsa en öncelikli yol odur - GIL'i
+# bırakarak koşar ve JIT ısınması gerektirmez
+try:
+    import _msp_crc
+    MSP_CRC_EXT_AVAILABLE = True
+except ImportError:
+    MSP_CRC_EXT_AVAILABLE = False
+
 # =============================================================================
 # MSP CONSTANTS
 # =============================================================================
@@ -75,6 +107,102 @@ RC_MID = 1500
 DEFAULT_TIMEOUT = 1.0    # saniye
 READ_TIMEOUT = 0.1       # saniye
 
+# Önceden derlenmiş Struct nesneleri: struct.pack/unpack her çağrıda
+# format string'ini yeniden ayrıştırır - sıcak yollar bu nesneleri
+# kullanır
+_U16X2 = struct.Struct('<HH')
+_U16X8 = struct.Struct('<8H')
+_U16X18 = struct.Struct('<18H')
+_I32 = struct.Struct('<i')
+_U64 = struct.Struct('<Q')
+
+# Simülasyon modunda _send_and_receive'in döndürdüğü sabit cevaplar:
+# frame kurulumu (CRC + tahsisler) ve parser tamamen atlanır
+_SIM_RESPONSES = {
+    MSP_ALTITUDE: _I32.pack(1000) + b'\x00\x00',  # 10.00m, vario=0
+    MSP_STATUS: b'\x00' * 11,                      # disarmed
+    MSP_FC_VARIANT: b'SIMU',
+    MSP_FC_VERSION: bytes((0, 0, 0)),
+    MSP_RC: _U16X18.pack(*([RC_MID] * 18)),
+}
+
+
+def _build_crc8_dvb_s2_table() -> bytes:
+    """
+    CRC8 DVB-S2 (polinom 0xD5) için 256 girişli lookup tablosu üret.
+
+    Tablo ile CRC bayt başına tek XOR + tablo erişimine iner; bit-bit
+    döngüde bayt başına 8 shift/xor adımı gerekir. bytes olarak
+    saklanır: indeksleme C düzeyinde doğrudan int döndürür.
+    """
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x80:
+                crc = ((crc << 1) ^ 0xD5) & 0xFF
+            else:
+                crc = (crc << 1) & 0xFF
+        table.append(crc)
+    return bytes(table)
+
+
+_CRC8_TABLE = _build_crc8_dvb_s2_table()
+
+
+def _build_crc8_slice_tables() -> Tuple[bytes, ...]:
+    """
+    Slice-by-8 için 8 yardımcı tablo üret.
+
+    _CRC8_SLICE[k][b] = "b baytını ve ardından k sıfır baytı" işlemenin
+    CRC'si. CRC lineer olduğundan 8 baytlık bir blok, her baytın kendi
+    pozisyon tablosundan okunan katkılarının XOR'una eşittir - böylece
+    Python döngüsü iterasyon başına 1 yerine 8 bayt tüketir.
+    """
+    tables = [_CRC8_TABLE]
+    for _ in range(7):
+        prev = tables[-1]
+        tables.append(bytes(_CRC8_TABLE[c] for c in prev))
+    return tuple(tables)
+
+
+_CRC8_SLICE = _build_crc8_slice_tables()
+
+if NUMBA_AVAILABLE:
+    _CRC8_TABLE_NP = np.frombuffer(_CRC8_TABLE, dtype=np.uint8)
+
+    @njit(cache=True, boundscheck=False)
+    def _crc8_dvbs2_nb(data):
+        """Derlenmiş CRC8 DVB-S2 çekirdeği (uint8[:] → int)."""
+        crc = 0
+        for i in range(data.shape[0]):
+            crc = _CRC8_TABLE_NP[crc ^ data[i]]
+        return crc
+
+    # Import sırasında (thread'ler doğmadan) derlemeyi tetikle -
+    # ilk gerçek frame derleme duraklaması görmesin
+    _crc8_dvbs2_nb(np.zeros(1, dtype=np.uint8))
+
+# MSP_SET_RAW_RC sabitleri (frame şablonu için)
+_RC_PAYLOAD_SIZE = 36     # 18 kanal × 2 byte
+_RC_PAYLOAD_OFF = 8       # header(3) + flag(1) + func(2) + size(2)
+_RC_FRAME_LEN = _RC_PAYLOAD_OFF + _RC_PAYLOAD_SIZE + 1  # + CRC
+
+
+def _fold_rc_crc_seed() -> int:
+    """
+    RC frame'inin değişmez flag+function+size önekinin CRC katkısını
+    bir kez katla. send_rc_override böylece her tick yalnızca 36
+    payload baytını tarar - önek baytları hiç işlenmez.
+    """
+    crc = 0
+    for b in struct.pack('<BHH', 0x00, MSP_SET_RAW_RC, _RC_PAYLOAD_SIZE):
+        crc = _CRC8_TABLE[crc ^ b]
+    return crc
+
+
+_RC_CRC_SEED = _fold_rc_crc_seed()
+
 
 class MSPProtocol:
     """
@@ -110,17 +238,55 @@ class MSPProtocol:
         
         # Serial port instance
         self._serial: Optional[serial.Serial] = None
-        
+
+        # Ham dosya tanıtıcısı: sıcak yol pyserial'in write sarmalayıcısı
+        # (her yazmada write-timeout kurulumu) yerine doğrudan os.write
+        # kullanır
+        self._fd: int = -1
+
         # Thread safety
         self._lock = threading.Lock()
         
-        # Son gönderilen RC değerleri
-        self._last_rc_channels = [RC_MID] * 18
-        
-        # İstatistikler
-        self._tx_count = 0
-        self._rx_count = 0
-        self._error_count = 0
+        # Son gönderilen RC değerleri: tipli u16 dizisi - 18 ayrı
+        # Python int nesnesi yerine 36 bayt ham depolama, her RC
+        # tick'inde int yeniden kutulama yok
+        self._last_rc_channels = array.array('H', [RC_MID] * 18)
+
+        # MSP_SET_RAW_RC frame şablonu: header/flag/function/size her
+        # gönderimde aynıdır - bir kez kurulur, her tick'te yalnızca
+        # kanal baytları ve CRC yerinde güncellenir
+        self._rc_frame = bytearray(_RC_FRAME_LEN)
+        self._rc_frame[0:3] = b'$X<'
+        struct.pack_into('<BHH', self._rc_frame, 3,
+                         0x00, MSP_SET_RAW_RC, _RC_PAYLOAD_SIZE)
+        _U16X18.pack_into(self._rc_frame, _RC_PAYLOAD_OFF,
+                          *([RC_MID] * 18))
+
+        # Nötr (hover) frame: SEARCHING/LOST her tick aynı komutu yollar.
+        # CRC'siyle birlikte bir kez dondurulur - sıcak yolda ne pack
+        # ne CRC koşar, yalnızca seri yazma kalır
+        hover = bytearray(self._rc_frame)
+        crc = 0
+        for b in hover[3:_RC_FRAME_LEN - 1]:
+            crc = _CRC8_TABLE[crc ^ b]
+        hover[_RC_FRAME_LEN - 1] = crc
+        self._hover_frame = bytes(hover)
+
+        # Genel frame builder için yeniden kullanılan TX buffer'ı:
+        # _build_msp_v2_frame ara bytes nesneleri üretmek yerine bunun
+        # içine pack_into ile yazar (MSP payload'ları < 1KB)
+        self._tx_buf = bytearray(1024)
+
+        # Batched-read parser'ın kalıcı alım tamponu: yarım kalan frame
+        # çağrılar arasında burada devreder, sync araması amortize olur
+        self._rx_buf = bytearray()
+
+        # İstatistikler: itertools.count C düzeyinde, GIL altında atomik
+        # ilerler - sıcak yolda int nesnesi yükle/topla/sakla üçlüsü ve
+        # kilit yok. Anlık değer tüketilmeden __reduce__ ile okunur
+        self._tx_count = itertools.count()
+        self._rx_count = itertools.count()
+        self._error_count = itertools.count()
         
         # Logger
         self._logger = logging.getLogger(__name__)
@@ -145,13 +311,19 @@ class MSPProtocol:
             return False
         
         try:
+            # exclusive=True: başka bir süreç aynı portu açıp tampon
+            # yığılmasına yol açamaz
+            # write_timeout=None: pyserial'in yazma başına timeout
+            # kurulumu atlanır - yazmalar zaten os.write ile yapılır
             self._serial = serial.Serial(
                 port=self.port,
                 baudrate=self.baudrate,
                 timeout=READ_TIMEOUT,
-                write_timeout=DEFAULT_TIMEOUT
+                write_timeout=None,
+                exclusive=True
             )
-            
+            self._fd = self._serial.fileno()
+
             # Tamponları temizle
             self._serial.reset_input_buffer()
             self._serial.reset_output_buffer()
@@ -169,9 +341,18 @@ class MSPProtocol:
     def disconnect(self):
         """
         Seri port bağlantısını kapat.
+
+        Kapatmadan önce TX tamponu boşaltılır - sıcak yol flush
+        yapmadığı için kuyrukta bekleyen son frame'ler burada drain
+        edilir.
         """
         if self._serial and self._serial.is_open:
+            try:
+                self._serial.flush()
+            except serial.SerialException:
+                pass
             self._serial.close()
+            self._fd = -1
             self._logger.info("Seri port kapatıldı")
     
     def is_connected(self) -> bool:
@@ -194,20 +375,46 @@ class MSPProtocol:
         MSP V2 protokolü DVB-S2 standardı kullanır.
         Polynomial: 0xD5
         
+        Gövde 8'er baytlık dilimler halinde tüketilir (slice-by-8):
+        iterasyon başına tek '<Q' unpack + 8 tablo erişimi. Artan
+        kuyruk baytları tek tablo ile bitirilir. 41 baytlık RC frame
+        CRC'si böylece ~5 Python iterasyonuna iner.
+
         Args:
             data: CRC hesaplanacak veri
-        
+
         Returns:
             int: 8-bit CRC değeri
         """
+        # Öncelik sırası: C uzantısı > numba kernel > saf Python tablo.
+        if MSP_CRC_EXT_AVAILABLE:
+            return _msp_crc.crc8_dvbs2(bytes(data))
+
+        # Numba varsa derlenmiş kernel: bayt başına tablo erişimi artık
+        # native kodda - dilimli Python yolu yalnızca fallback.
+        # (Kernel içinde slice-by-8'e gerek yok; native döngü zaten
+        # belleğe bağlı hızda koşar)
+        if NUMBA_AVAILABLE:
+            return int(_crc8_dvbs2_nb(np.frombuffer(data, dtype=np.uint8)))
+
         crc = 0x00
-        for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x80:
-                    crc = ((crc << 1) ^ 0xD5) & 0xFF
-                else:
-                    crc = (crc << 1) & 0xFF
+        i = 0
+        n = len(data)
+
+        if n >= 8:
+            s0, s1, s2, s3, s4, s5, s6, s7 = _CRC8_SLICE
+            unpack_from = _U64.unpack_from
+            for i in range(0, n - 7, 8):
+                w = unpack_from(data, i)[0] ^ crc
+                crc = (s7[w & 0xFF] ^ s6[(w >> 8) & 0xFF]
+                       ^ s5[(w >> 16) & 0xFF] ^ s4[(w >> 24) & 0xFF]
+                       ^ s3[(w >> 32) & 0xFF] ^ s2[(w >> 40) & 0xFF]
+                       ^ s1[(w >> 48) & 0xFF] ^ s0[w >> 56])
+            i += 8
+
+        table = _CRC8_TABLE
+        for byte in data[i:]:
+            crc = table[crc ^ byte]
         return crc
     
     # =========================================================================
@@ -231,30 +438,26 @@ class MSPProtocol:
         Args:
             function: MSP function ID
             payload: Payload verisi
-        
+
         Returns:
             bytes: Oluşturulan frame
         """
-        # Header
-        header = bytes([MSP_V2_START, MSP_V2_IDENT, MSP_V2_REQUEST])
-        
-        # Flag (always 0 for normal messages)
-        flag = bytes([0x00])
-        
-        # Function ID (2 bytes, little endian)
-        func_bytes = struct.pack('<H', function)
-        
-        # Payload size (2 bytes, little endian)
-        size_bytes = struct.pack('<H', len(payload))
-        
-        # CRC hesapla (flag + function + size + payload)
-        crc_data = flag + func_bytes + size_bytes + payload
-        crc = self._calculate_crc8_dvb_s2(crc_data)
-        
-        # Frame oluştur
-        frame = header + crc_data + bytes([crc])
-        
-        return frame
+        # Parçaları ayrı bytes nesneleri olarak kurup birleştirmek
+        # frame başına ~6 geçici ayırma demekti; bunun yerine kalıcı
+        # TX buffer'ına pack_into ile yazılır ve tek kopya döndürülür.
+        # Buffer paylaşıldığı için kilit altında yazılır
+        n = len(payload)
+        with self._lock:
+            buf = self._tx_buf
+            buf[0:4] = b'$X<\x00'
+            _U16X2.pack_into(buf, 4, function, n)
+            buf[8:8 + n] = payload
+
+            # CRC: flag+function+size+payload (memoryview - kopyasız)
+            crc = self._calculate_crc8_dvb_s2(memoryview(buf)[3:8 + n])
+            buf[8 + n] = crc
+
+            return bytes(buf[:8 + n + 1])
     
     # =========================================================================
     # FRAME PARSING
@@ -264,133 +467,241 @@ class MSPProtocol:
         """
         MSP V2 cevabını oku ve parse et.
         
+        Alan başına ayrı read() (7+ syscall/cevap) yerine: select ile
+        veri beklenir, gelen her şey os.read ile tek seferde kalıcı
+        rx buffer'ına çekilir ve tam frame'ler buffer'dan ayrıştırılır.
+        Yarım kalan frame bir sonraki çağrıya devreder - tipik 15
+        baytlık cevap tek syscall'la okunur.
+
         Args:
             timeout: Okuma timeout süresi
-        
+
         Returns:
             Tuple[function_id, payload] veya None (hata durumunda)
         """
         if self.simulation:
             return None
-        
+
         if not self._serial:
             return None
-        
-        start_time = time.time()
-        
+
+        # Döngüde her turda çözülen attribute/global erişimleri bir kez
+        # yerel isme bağlanır (LOAD_FAST, descriptor protokolü yok)
+        fd = self._serial.fileno()
+        buf = self._rx_buf
+        sel = select.select
+        read_fd = os.read
+        now = time.time
+        deadline = now() + timeout
+
         try:
-            # Frame başlangıcını bul ($X>)
-            while time.time() - start_time < timeout:
-                # İlk byte oku
-                byte = self._serial.read(1)
-                if not byte:
-                    continue
-                
-                if byte[0] != MSP_V2_START:
-                    continue
-                
-                # İkinci byte
-                byte = self._serial.read(1)
-                if not byte or byte[0] != MSP_V2_IDENT:
-                    continue
-                
-                # Üçüncü byte (direction)
-                byte = self._serial.read(1)
-                if not byte:
-                    continue
-                
-                direction = byte[0]
-                
-                if direction == MSP_V2_ERROR:
-                    self._logger.warning("MSP Error response alındı")
-                    self._error_count += 1
-                    return None
-                
-                if direction != MSP_V2_RESPONSE:
-                    continue
-                
-                # Flag (1 byte)
-                flag = self._serial.read(1)
-                if not flag:
-                    return None
-                
-                # Function ID (2 bytes)
-                func_bytes = self._serial.read(2)
-                if len(func_bytes) != 2:
-                    return None
-                function = struct.unpack('<H', func_bytes)[0]
-                
-                # Payload size (2 bytes)
-                size_bytes = self._serial.read(2)
-                if len(size_bytes) != 2:
-                    return None
-                payload_size = struct.unpack('<H', size_bytes)[0]
-                
-                # Payload
-                payload = b''
-                if payload_size > 0:
-                    payload = self._serial.read(payload_size)
-                    if len(payload) != payload_size:
+            while True:
+                # -------------------------------------------------------------
+                # Buffer'dan tam frame ayrıştırmayı dene
+                # -------------------------------------------------------------
+                # Sync taraması: '$X' imzası C hızında aranır
+                # (bytes.find) - gürültüde bayt başına Python
+                # karşılaştırması yok. Yön baytı ayrıca incelenir ki
+                # '$X!' hata frame'leri de yakalansın
+                n = len(buf)
+                idx = buf.find(b'$X')
+                if idx > 0:
+                    del buf[:idx]
+                    n = len(buf)
+                elif idx < 0 and n > 1:
+                    # İmza yok: olası sınır eşleşmesi ('$' son baytta
+                    # kalmış olabilir) için yalnızca son bayt tutulur
+                    del buf[:n - 1]
+                    n = 1
+
+                if n >= 3:
+                    direction = buf[2]
+
+                    if direction == MSP_V2_ERROR:
+                        self._logger.warning("MSP Error response alındı")
+                        next(self._error_count)
+                        del buf[:3]
                         return None
-                
-                # CRC
-                crc_byte = self._serial.read(1)
-                if not crc_byte:
+
+                    if direction != MSP_V2_RESPONSE:
+                        # Yanlış yön - sync baytını atla, yeniden ara
+                        del buf[:1]
+                        continue
+
+                    if n >= 8:
+                        function, payload_size = _U16X2.unpack_from(buf, 4)
+                        frame_len = 8 + payload_size + 1
+
+                        if n >= frame_len:
+                            # Frame bütün halde buffer'da: CRC doğrula,
+                            # tüket ve döndür. CRC doğrudan rx buffer'ı
+                            # üzerindeki memoryview'dan hesaplanır -
+                            # frame başına ara bytes kopyası yok.
+                            # (View'lar buffer küçültülmeden önce
+                            # elle bırakılır)
+                            payload = bytes(buf[8:8 + payload_size])
+                            received_crc = buf[frame_len - 1]
+                            mv = memoryview(buf)
+                            crc_view = mv[3:frame_len - 1]
+                            calculated_crc = \
+                                self._calculate_crc8_dvb_s2(crc_view)
+                            crc_view.release()
+                            mv.release()
+                            del buf[:frame_len]
+
+                            if received_crc != calculated_crc:
+                                self._logger.warning("CRC hatası! "
+                                                     "Beklenen: %d, "
+                                                     "Alınan: %d",
+                                                     calculated_crc,
+                                                     received_crc)
+                                next(self._error_count)
+                                return None
+
+                            next(self._rx_count)
+                            return (function, payload)
+
+                # -------------------------------------------------------------
+                # Tam frame yok - yeni veriyi toplu oku
+                # -------------------------------------------------------------
+                remaining = deadline - now()
+                if remaining <= 0:
                     return None
-                received_crc = crc_byte[0]
-                
-                # CRC doğrula
-                crc_data = flag + func_bytes + size_bytes + payload
-                calculated_crc = self._calculate_crc8_dvb_s2(crc_data)
-                
-                if received_crc != calculated_crc:
-                    self._logger.warning(f"CRC hatası! Beklenen: {calculated_crc}, "
-                                        f"Alınan: {received_crc}")
-                    self._error_count += 1
+
+                readable, _, _ = sel([fd], [], [], remaining)
+                if not readable:
                     return None
-                
-                self._rx_count += 1
-                return (function, payload)
-            
-            return None
-            
-        except serial.SerialException as e:
-            self._logger.error(f"Serial okuma hatası: {e}")
-            self._error_count += 1
+
+                chunk = read_fd(fd, 256)
+                if chunk:
+                    buf += chunk
+
+        except (OSError, serial.SerialException) as e:
+            self._logger.error("Serial okuma hatası: %s", e)
+            next(self._error_count)
             return None
     
     # =========================================================================
     # SEND / RECEIVE
     # =========================================================================
     
-    def _send_frame(self, frame: bytes) -> bool:
+    def _write_all(self, data: bytes) -> None:
         """
-        Frame'i seri porta gönder.
-        
+        Baytları doğrudan os.write ile porta yaz (kilitsiz iç yardımcı).
+
+        pyserial'in write() sarmalayıcısı her çağrıda write-timeout
+        mekanizmasını kurar; RC akışı gibi küçük ve sık yazmalarda bu
+        vergi baytların kendisinden pahalıdır. Kernel TX kuyruğu dolursa
+        (45 bayt / 50ms'de pratikte olmaz) yazılabilirlik select ile
+        beklenir.
+
+        Args:
+            data: Yazılacak baytlar
+
+        Raises:
+            OSError: Yazma hatasında
+        """
+        fd = self._fd
+        mv = memoryview(data)
+        n = 0
+        total = len(mv)
+        while n < total:
+            try:
+                n += os.write(fd, mv[n:])
+            except BlockingIOError:
+                select.select([], [fd], [], DEFAULT_TIMEOUT)
+
+    def _send_frame_unlocked(self, frame: bytes, flush: bool = False) -> bool:
+        """
+        Frame'i seri porta gönder (kilitsiz iç varyant).
+
+        Çağıran self._lock'u tutmalıdır. _send_and_receive gibi kilidi
+        zaten almış yollar doğrudan bunu kullanır; threading.Lock
+        reentrant olmadığından iç içe acquire kilitlenmeye yol açar.
+
+        flush (tcdrain) varsayılan olarak YAPILMAZ: 115200 baud'da 45
+        baytlık frame'in fiziksel aktarımını beklemek ~3.8ms bloklar ve
+        bir sonraki yazma zaten aynı kernel TX kuyruğuna girer. flush
+        yalnızca kapanışta tamponu boşaltmak içindir.
+
         Args:
             frame: Gönderilecek frame
-        
+            flush: True ise aktarım bitene kadar bekle (tcdrain)
+
         Returns:
             bool: Başarılı ise True
         """
         if self.simulation:
-            self._tx_count += 1
+            next(self._tx_count)
             return True
-        
+
         if not self._serial:
             return False
-        
+
+        try:
+            self._write_all(frame)
+            if flush:
+                self._serial.flush()
+            next(self._tx_count)
+            return True
+        except (OSError, serial.SerialException) as e:
+            self._logger.error("Serial yazma hatası: %s", e)
+            next(self._error_count)
+            return False
+
+    def _send_frame(self, frame: bytes, flush: bool = False) -> bool:
+        """
+        Frame'i seri porta gönder (kilitli dış kapı).
+
+        Args:
+            frame: Gönderilecek frame
+            flush: True ise aktarım bitene kadar bekle (tcdrain)
+
+        Returns:
+            bool: Başarılı ise True
+        """
+        with self._lock:
+            return self._send_frame_unlocked(frame, flush)
+    
+    def _send_frames(self, frames: Iterable[bytes], flush: bool = False) -> bool:
+        """
+        Birden çok frame'i tek write() çağrısıyla gönder.
+
+        Frame başına write + tcdrain yerine N frame birleştirilip tek
+        POSIX write ile kuyruklanır - toplu submit kazancının TTY
+        karşılığı. Drain varsayılan olarak yapılmaz (_send_frame'deki
+        gerekçeyle aynı).
+
+        Args:
+            frames: Gönderilecek frame'ler
+            flush: True ise aktarım bitene kadar bekle (tcdrain)
+
+        Returns:
+            bool: Başarılı ise True
+        """
+        frames = list(frames)
+
+        if self.simulation:
+            for _ in frames:
+                next(self._tx_count)
+            return True
+
+        if not self._serial:
+            return False
+
         with self._lock:
             try:
-                self._serial.write(frame)
-                self._serial.flush()
-                self._tx_count += 1
+                self._write_all(b''.join(frames))
+                if flush:
+                    self._serial.flush()
+                for _ in frames:
+                    next(self._tx_count)
                 return True
-            except serial.SerialException as e:
-                self._logger.error(f"Serial yazma hatası: {e}")
-                self._error_count += 1
+            except (OSError, serial.SerialException) as e:
+                self._logger.error("Serial yazma hatası: %s", e)
+                next(self._error_count)
                 return False
-    
+
     def _send_and_receive(self, function: int, payload: bytes = b'',
                          timeout: float = DEFAULT_TIMEOUT) -> Optional[bytes]:
         """
@@ -404,12 +715,21 @@ class MSPProtocol:
         Returns:
             bytes: Cevap payload veya None
         """
+        # Simülasyonda frame kurulumu (CRC + tahsis) ve parser gereksiz:
+        # sabit cevap tablosundan doğrudan dön
+        if self.simulation:
+            next(self._tx_count)
+            return _SIM_RESPONSES.get(function)
+
         frame = self._build_msp_v2_frame(function, payload)
-        
+
+        # Kilit bir kez burada alınır; _send_frame'in kilitli dış kapısı
+        # yerine kilitsiz iç varyant çağrılır (threading.Lock reentrant
+        # değil - iç içe acquire kilitlenirdi).
         with self._lock:
-            if not self._send_frame(frame):
+            if not self._send_frame_unlocked(frame):
                 return None
-            
+
             result = self._parse_msp_v2_response(timeout)
             if result:
                 recv_func, recv_payload = result
@@ -453,40 +773,71 @@ class MSPProtocol:
             ÖNEMLİ: MSP gönderme hızı minimum 5Hz olmalı!
             5Hz altında INAV otomatik olarak RC receiver'a döner.
         """
-        # Değerleri sınırla
-        def clamp(val):
-            return max(RC_MIN, min(RC_MAX, int(val)))
-        
-        # Kanal değerlerini hazırla (18 kanal için)
-        # INAV 18 kanal bekler ama biz ilk 8'ini kullanıyoruz
-        channels = [
-            clamp(roll),
-            clamp(pitch),
-            clamp(throttle),
-            clamp(yaw),
-            clamp(aux1),
-            clamp(aux2),
-            clamp(aux3),
-            clamp(aux4),
-        ]
-        
-        # Geri kalan kanalları 1500 (nötr) yap
-        while len(channels) < 18:
-            channels.append(RC_MID)
-        
-        # Payload oluştur (18 kanal × 2 byte = 36 byte)
-        # Little endian unsigned short format
-        payload = struct.pack('<' + 'H' * 18, *channels)
-        
-        # Frame oluştur ve gönder
-        frame = self._build_msp_v2_frame(MSP_SET_RAW_RC, payload)
-        success = self._send_frame(frame)
-        
+        # 8 kanal satır içi koşullu ifadelerle sınırlanır - fonksiyon
+        # çağrısı, closure ve (8 eleman için pahalı kalan) numpy dizisi
+        # yok; pack_into LE u16 baytlarını doğrudan şablona yazar.
+        # INAV 18 kanal bekler - kalan 10 kanal şablonda RC_MID durur
+        channels = (
+            RC_MIN if roll < RC_MIN else RC_MAX if roll > RC_MAX else roll,
+            RC_MIN if pitch < RC_MIN else RC_MAX if pitch > RC_MAX else pitch,
+            RC_MIN if throttle < RC_MIN else RC_MAX if throttle > RC_MAX
+            else throttle,
+            RC_MIN if yaw < RC_MIN else RC_MAX if yaw > RC_MAX else yaw,
+            RC_MIN if aux1 < RC_MIN else RC_MAX if aux1 > RC_MAX else aux1,
+            RC_MIN if aux2 < RC_MIN else RC_MAX if aux2 > RC_MAX else aux2,
+            RC_MIN if aux3 < RC_MIN else RC_MAX if aux3 > RC_MAX else aux3,
+            RC_MIN if aux4 < RC_MIN else RC_MAX if aux4 > RC_MAX else aux4,
+        )
+
+        # Simülasyonda frame paketleme + CRC atlanır: yalnızca son
+        # değerler ve sayaç güncellenir
+        if self.simulation:
+            next(self._tx_count)
+            self._last_rc_channels[:8] = array.array('H', channels)
+            return True
+
+        # Şablon paylaşılan instance alanıdır: patch + CRC + yazma TEK
+        # kilit penceresinde yapılır (_send_frames'teki gibi kilitsiz
+        # yardımcı çağrılır) - aksi halde eşzamanlı iki çağıran
+        # şablonu birbirinin altından yamalayıp bozuk frame / uyumsuz
+        # CRC gönderebilirdi
+        with self._lock:
+            frame = self._rc_frame
+            _U16X8.pack_into(frame, _RC_PAYLOAD_OFF, *channels)
+
+            # CRC: önekin (flag+function+size) katkısı import sırasında
+            # katlandı - burada yalnızca 36 payload baytı taranır
+            # (memoryview: dilim kopyası yok)
+            crc = _RC_CRC_SEED
+            table = _CRC8_TABLE
+            for b in memoryview(frame)[_RC_PAYLOAD_OFF:_RC_FRAME_LEN - 1]:
+                crc = table[crc ^ b]
+            frame[_RC_FRAME_LEN - 1] = crc
+
+            success = self._send_frame_unlocked(frame)
+
         if success:
-            self._last_rc_channels[:8] = channels[:8]
-        
+            self._last_rc_channels[:8] = array.array('H', channels)
+
         return success
-    
+
+    def send_rc_hover(self) -> bool:
+        """
+        Önceden kurulmuş nötr (hover) RC frame'ini gönder.
+
+        Frame __init__'te CRC'siyle birlikte hazırlandığından burada
+        clamp/pack/CRC maliyeti yoktur.
+
+        Returns:
+            bool: Başarılı ise True
+        """
+        success = self._send_frame(self._hover_frame)
+
+        if success:
+            self._last_rc_channels[:8] = array.array('H', [RC_MID] * 8)
+
+        return success
+
     def send_rc_channels(self, channels: List[int]) -> bool:
         """
         Tüm RC kanallarını tek seferde gönder.
@@ -497,18 +848,47 @@ class MSPProtocol:
         Returns:
             bool: Başarılı ise True
         """
-        # 18 kanala tamamla
-        ch = list(channels)
-        while len(ch) < 18:
-            ch.append(RC_MID)
-        
-        # Sınırla
-        ch = [max(RC_MIN, min(RC_MAX, int(c))) for c in ch[:18]]
-        
-        payload = struct.pack('<' + 'H' * 18, *ch)
+        # 18 kanala RC_MID ile tamamla ve tek vektörize clip ile
+        # sınırla; '<u2' LE baytları payload'ın kendisidir - 18'li
+        # struct.pack yıldız açılımı yok
+        arr = np.full(18, RC_MID, dtype=np.int32)
+        given = np.asarray(channels[:18], dtype=np.int32)
+        arr[:given.shape[0]] = given
+        np.clip(arr, RC_MIN, RC_MAX, out=arr)
+
+        payload = arr.astype('<u2').tobytes()
         frame = self._build_msp_v2_frame(MSP_SET_RAW_RC, payload)
-        
+
         return self._send_frame(frame)
+
+    def send_rc_stream(self, channels_iter: Iterable[List[int]]) -> bool:
+        """
+        Birden çok RC kanal kümesini tek seri yazmayla gönder.
+
+        Arka arkaya frame göndermek her birinde ayrı syscall öder;
+        burada tüm frame'ler kurulur ve _send_frames ile tek write()
+        olarak kuyruklanır. Test/burst senaryoları için.
+
+        Args:
+            channels_iter: Her öğesi send_rc_channels biçiminde kanal
+                listesi olan dizi
+
+        Returns:
+            bool: Başarılı ise True
+        """
+        frames = []
+        for channels in channels_iter:
+            arr = np.full(18, RC_MID, dtype=np.int32)
+            given = np.asarray(list(channels)[:18], dtype=np.int32)
+            arr[:given.shape[0]] = given
+            np.clip(arr, RC_MIN, RC_MAX, out=arr)
+            frames.append(self._build_msp_v2_frame(
+                MSP_SET_RAW_RC, arr.astype('<u2').tobytes()))
+
+        if not frames:
+            return True
+
+        return self._send_frames(frames)
     
     # =========================================================================
     # TELEMETRY REQUESTS
@@ -530,7 +910,7 @@ class MSPProtocol:
         
         if response and len(response) >= 4:
             # İlk 4 byte: altitude in cm (signed int32)
-            altitude_cm = struct.unpack('<i', response[:4])[0]
+            altitude_cm = _I32.unpack_from(response, 0)[0]
             return altitude_cm / 100.0  # cm → m
         
         return None
@@ -573,23 +953,35 @@ class MSPProtocol:
         """
         if self.simulation:
             return {'name': 'SIMULATION', 'version': '0.0.0'}
-        
+
         info = {}
-        
-        # FC Variant (INAV, BTFL, etc.)
-        response = self._send_and_receive(MSP_FC_VARIANT)
-        if response:
-            # 4 byte ASCII identifier
-            info['name'] = response[:4].decode('ascii', errors='ignore').strip()
-        
-        # FC Version
-        response = self._send_and_receive(MSP_FC_VERSION)
-        if response and len(response) >= 3:
-            major = response[0]
-            minor = response[1]
-            patch = response[2]
-            info['version'] = f"{major}.{minor}.{patch}"
-        
+
+        # İki istek tek write() ile arka arkaya kuyruklanır (pipeline):
+        # ardışık iki tam gidiş-dönüş yerine tek gidiş + iki cevap -
+        # el sıkışma süresi yarıya iner. Tamponlu parser iki cevabı da
+        # aynı rx buffer'ından sırayla çıkarır (MSP V2 istek sırasını
+        # korur)
+        frame_variant = self._build_msp_v2_frame(MSP_FC_VARIANT)
+        frame_version = self._build_msp_v2_frame(MSP_FC_VERSION)
+
+        with self._lock:
+            if not self._send_frame_unlocked(frame_variant + frame_version):
+                return None
+
+            for _ in range(2):
+                result = self._parse_msp_v2_response(DEFAULT_TIMEOUT)
+                if not result:
+                    break
+                recv_func, response = result
+
+                if recv_func == MSP_FC_VARIANT and response:
+                    # 4 byte ASCII identifier (INAV, BTFL, etc.)
+                    info['name'] = \
+                        response[:4].decode('ascii', errors='ignore').strip()
+                elif recv_func == MSP_FC_VERSION and len(response) >= 3:
+                    major, minor, patch = response[0], response[1], response[2]
+                    info['version'] = f"{major}.{minor}.{patch}"
+
         return info if info else None
     
     def request_rc_channels(self) -> Optional[List[int]]:
@@ -602,7 +994,7 @@ class MSPProtocol:
             List[int]: Kanal değerleri veya None
         """
         if self.simulation:
-            return self._last_rc_channels[:8]
+            return list(self._last_rc_channels[:8])
         
         response = self._send_and_receive(MSP_RC)
         
@@ -623,9 +1015,9 @@ class MSPProtocol:
         İletişim istatistiklerini döndür.
         """
         return {
-            'tx_count': self._tx_count,
-            'rx_count': self._rx_count,
-            'error_count': self._error_count,
+            'tx_count': self._tx_count.__reduce__()[1][0],
+            'rx_count': self._rx_count.__reduce__()[1][0],
+            'error_count': self._error_count.__reduce__()[1][0],
             'connected': self.is_connected()
         }
     
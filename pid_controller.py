@@ -25,9 +25,80 @@ Not:
 ===============================================================================
 """
 
+import math
 import time
 import logging
-from typing import Optional
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# Numba (JIT derleme - opsiyonel): compute()'un sayısal çekirdeği saf
+# skaler float aritmetiği - derlenmiş kernel attribute erişimi ve
+# bytecode vergisini sıcak yoldan kaldırır
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _pid_step(kp: float, ki: float, kd: float, kt: float,
+              error: float, prev_error: float, d_error: float,
+              integral: float, dt: float,
+              out_min: float, out_max: float):
+    """
+    PID adımının sayısal çekirdeği: terimleri topla, çıkışı sınırla,
+    integrali back-calculation ile biriktir.
+
+    Anti-windup back-calculation (Åström-Rundqwist) ile yapılır:
+    doygunluk fazlası kt kazancıyla integratöre geri beslenir -
+    dalsız (tek çıkarma + çarpma + toplama), koşullu integrasyona göre
+    daha yumuşak toparlanır ve integrali doğal olarak sınırlar; ayrı
+    clamp gerekmez. Doygun değilken geri besleme terimi sıfırdır.
+
+    Zaman/bookkeeping Python tarafında kalır; burada yalnızca float
+    aritmetiği koşar ki numba ile derlendiğinde tek çağrıya insin.
+
+    Returns:
+        Tuple[float, float]: (output, yeni integral)
+    """
+    u_unsat = kp * error + ki * integral + kd * d_error
+
+    if u_unsat > out_max:
+        output = out_max
+    elif u_unsat < out_min:
+        output = out_min
+    else:
+        output = u_unsat
+
+    if ki != 0.0:
+        # Trapez integrasyon: Riemann toplamına göre ayrıklaştırma
+        # hatası yarıya iner (aynı maliyet: bir toplama + çarpma)
+        integral += (0.5 * (error + prev_error)
+                     + kt * (output - u_unsat)) * dt
+
+    return output, integral
+
+
+if NUMBA_AVAILABLE:
+    _pid_step = njit(cache=True, fastmath=True)(_pid_step)
+    # İlk çağrı derlemeyi tetikler - import sırasında ısıt ki kontrol
+    # döngüsünün ilk tick'i derleme duraklaması yemesin
+    _pid_step(1.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.05, -1.0, 1.0)
+
+# Ayrıca derlenmiş çekirdek (opsiyonel, numba'dan da önce): kurulumda
+# Cython/cdef ile derlenmiş bir _pid_core uzantısı bulunursa onun
+# pid_step'i kullanılır - çağrı başı maliyet ~50ns'ye iner ve GIL'siz
+# koşabilir. Beklenen imza Python _pid_step ile birebir aynıdır:
+# pid_step(kp, ki, kd, kt, error, prev_error, d_error, integral, dt,
+#          out_min, out_max) -> (output, integral)
+# Depoda build altyapısı olmadığından (bkz. msp_protocol._msp_crc)
+# uzantı kurulum tarafına bırakılmıştır
+try:
+    from _pid_core import pid_step as _pid_step  # noqa: F811
+    PID_CORE_AVAILABLE = True
+except ImportError:
+    PID_CORE_AVAILABLE = False
 
 
 class PIDController:
@@ -48,12 +119,24 @@ class PIDController:
         ...     output = pid.compute(error)
         ...     actuator.set(output)
     """
-    
+
+    # __slots__: attribute'lar __dict__ hash araması yerine C dizisi
+    # ofsetinden okunur; instance ~3x küçülür (çoklu araç simülasyonu).
+    # 'compute' de bir slottur - __init__ özelleşmiş varyantı buraya
+    # bağlar
+    __slots__ = ('kp', 'ki', 'kd', 'kt', '_kt_fixed',
+                 'output_min', 'output_max', 'integral_max',
+                 'sample_time', 'reverse', 'name',
+                 '_integral', '_prev_error', '_prev_measurement',
+                 '_last_time_ns', '_first_run',
+                 '_terms_buf', '_logger', 'compute')
+
     def __init__(self, kp: float = 1.0, ki: float = 0.0, kd: float = 0.0,
                  output_min: float = -1.0, output_max: float = 1.0,
                  integral_max: float = None,
                  sample_time: float = None,
                  reverse: bool = False,
+                 kt: float = None,
                  name: str = "PID"):
         """
         PID kontrolcü oluştur.
@@ -80,6 +163,9 @@ class PIDController:
             sample_time: Örnekleme süresi (saniye)
                         None ise otomatik hesaplanır
             reverse: True ise çıkış ters çevrilir
+            kt: Back-calculation (anti-windup) izleme kazancı
+                None ise Åström kuralıyla hesaplanır: sqrt(|ki/kd|),
+                kd=0 ise 1/|ki|, ki=0 ise 0
             name: Debug için kontrolcü adı
         """
         # Kazançlar
@@ -91,8 +177,18 @@ class PIDController:
         self.output_min = output_min
         self.output_max = output_max
         
-        # Integral limiti (anti-windup)
+        # Integral limiti (eski clamp tabanlı anti-windup'ın API
+        # kalıntısı - sıcak yol artık back-calculation kullanır)
         self.integral_max = integral_max if integral_max else abs(output_max)
+
+        # Back-calculation izleme kazancı (Åström kuralı). Kullanıcı
+        # kt verdiyse yapışkandır: set_gains türetilmiş değeri tazeler,
+        # elle verileni korur
+        self._kt_fixed = kt is not None
+        if kt is not None:
+            self.kt = kt
+        else:
+            self.kt = self._derived_kt(ki, kd)
         
         # Örnekleme süresi
         self.sample_time = sample_time  # None = otomatik
@@ -105,104 +201,224 @@ class PIDController:
         
         # İç durumlar
         self._integral = 0.0          # Integral biriktirici
-        self._prev_error = 0.0        # Önceki hata (derivative için)
-        self._prev_measurement = None # Önceki ölçüm (derivative kick önleme)
-        self._last_time = None        # Son hesaplama zamanı
+        self._prev_error = 0.0        # Önceki hata (trapez integrasyon için)
+        self._prev_measurement = 0.0  # Önceki ölçüm (derivative kick önleme)
+        self._last_time_ns = 0        # Son hesaplama zamanı (monotonic ns)
         self._first_run = True        # İlk çalışma mı?
         
+        # get_terms için yeniden kullanılan tampon sözlük: telemetri
+        # her yoklamada yeni dict tahsis etmesin
+        self._terms_buf = {'p': 0.0, 'i': 0.0, 'd': 0.0,
+                           'integral': 0.0, 'error': 0.0}
+
         # Logger
         self._logger = logging.getLogger(__name__)
-    
+
+        # Sıfır kazançlara göre özelleşmiş compute varyantını bağla:
+        # ölü terimlerin dalları tick başına hiç koşmaz
+        self.compute = self._mk_compute()
+
+    @staticmethod
+    def _derived_kt(ki: float, kd: float) -> float:
+        """
+        Åström kuralıyla izleme kazancı türet.
+
+        ki=0 iken integratör hiç koşmaz; kt anlamsızdır ve 0 döner -
+        eski 1/max(ki, 1e-9) formu burada 1e9 üretip Ki sonradan
+        açıldığında ilk doygunlukta integratörü patlatıyordu.
+
+        Returns:
+            float: sqrt(|ki/kd|), kd=0 ise 1/|ki|, ki=0 ise 0.0
+        """
+        if ki == 0.0:
+            return 0.0
+        if kd:
+            return math.sqrt(abs(ki / kd))
+        return 1.0 / abs(ki)
+
     # =========================================================================
     # MAIN COMPUTE
     # =========================================================================
     
-    def compute(self, error: float, measurement: float = None) -> float:
+    def _compute_pid(self, error: float, measurement: float = None) -> float:
         """
-        PID çıkışını hesapla.
-        
+        PID çıkışını hesapla (tam P+I+D yolu).
+
+        __init__ ve set_gains sıfır olmayan kazançlara göre bu metodun
+        özelleşmiş bir varyantını (P/PI/PD/PID) self.compute slotuna
+        bağlar - örn. saf P kontrolcü tick başına ne zaman okur ne
+        integral taşır. Çağıranlar her zaman pid.compute(...) kullanır;
+        __slots__ nedeniyle compute bir instance slotudur, sınıf metodu
+        değil.
+
         Args:
             error: Hata değeri (setpoint - measurement)
-            measurement: Ölçüm değeri (derivative kick önleme için, opsiyonel)
-        
+            measurement: Ölçüm değeri. None ise sabit setpoint
+                         varsayımıyla -error kullanılır (türev yolu
+                         her zaman ölçüm üzerinden koşar)
+
         Returns:
             float: PID çıkışı (output_min ile output_max arasında)
-        
+
         Note:
             - Bu fonksiyon düzenli aralıklarla çağrılmalı
             - sample_time verilmemişse otomatik hesaplanır
         """
-        # Zaman farkını hesapla
-        current_time = time.time()
-        
-        if self._last_time is None:
+        # Zaman farkını hesapla: monotonic_ns duvar saatinden bağımsız
+        # (NTP sıçramaları dt'yi bozamaz) ve tamsayı döner. Bölme her
+        # iki terimde de tekrarlanmasın diye tersi bir kez alınır
+        now_ns = time.monotonic_ns()
+
+        if self._last_time_ns == 0:
             # İlk çalışma
             dt = self.sample_time if self.sample_time else 0.05  # 50ms varsayılan
             self._first_run = True
         else:
-            dt = current_time - self._last_time
-            if dt <= 0:
-                dt = 0.001  # Minimum dt
-        
-        self._last_time = current_time
+            dt_ns = now_ns - self._last_time_ns
+            dt = dt_ns * 1e-9 if dt_ns > 0 else 0.001  # Minimum dt
+
+        self._last_time_ns = now_ns
+        inv_dt = 1.0 / dt
         
         # Yön düzeltme
         if self.reverse:
             error = -error
-        
-        # ---------------------------------------------------------------------
-        # P TERİMİ (Proportional)
-        # ---------------------------------------------------------------------
-        # Anlık hataya orantılı
-        p_term = self.kp * error
-        
-        # ---------------------------------------------------------------------
-        # I TERİMİ (Integral)
-        # ---------------------------------------------------------------------
-        # Hata birikimini hesapla (Riemann sum)
-        if self.ki != 0:
-            self._integral += error * dt
-            
-            # Anti-windup: Integral'i sınırla
-            self._integral = self._clamp(self._integral, 
-                                         -self.integral_max, 
-                                         self.integral_max)
-        
-        i_term = self.ki * self._integral
-        
+
+        # Ölçüm verilmediyse sabit setpoint varsayımıyla hatadan türet
+        # (error = setpoint - measurement): türev yolu tek kalır, her
+        # tick'te iç içe is-None çatalı koşmaz
+        if measurement is None:
+            measurement = -error
+
         # ---------------------------------------------------------------------
-        # D TERİMİ (Derivative)
+        # D GİRDİSİ (Derivative on measurement)
         # ---------------------------------------------------------------------
-        # Hata değişim hızı
+        # Ölçüm değişimine göre hesapla: setpoint sıçramaları türeve
+        # sızmaz (derivative kick önleme)
         if self.kd != 0 and not self._first_run:
-            if measurement is not None and self._prev_measurement is not None:
-                # Derivative on measurement (kick önleme)
-                # Ölçüm değişimine göre hesapla (setpoint değişimini yoksay)
-                d_error = -(measurement - self._prev_measurement) / dt
-            else:
-                # Derivative on error
-                d_error = (error - self._prev_error) / dt
-            
-            d_term = self.kd * d_error
+            d_error = -(measurement - self._prev_measurement) * inv_dt
         else:
-            d_term = 0.0
-        
+            d_error = 0.0
+
+        # İlk çalışmada trapez integrasyon bayat prev_error, türev de
+        # bayat prev_measurement kullanmasın
+        if self._first_run:
+            self._prev_error = error
+            self._prev_measurement = measurement
+
+        # ---------------------------------------------------------------------
+        # P + I + D (sayısal çekirdek)
+        # ---------------------------------------------------------------------
+        # Integral güncelleme/sınırlama, terim toplamı ve çıkış sınırlama
+        # tek kernel çağrısında (numba varsa derlenmiş)
+        output, self._integral = _pid_step(
+            self.kp, self.ki, self.kd, self.kt,
+            error, self._prev_error, d_error,
+            self._integral, dt,
+            self.output_min, self.output_max)
+
         # Önceki değerleri kaydet
         self._prev_error = error
-        if measurement is not None:
+        self._prev_measurement = measurement
+        self._first_run = False
+
+        return output
+
+    # -------------------------------------------------------------------------
+    # Özelleşmiş compute varyantları: sıfır kazançlı terimlerin kodu
+    # tamamen atılmıştır (kısmi değerlendirme) - saf P kontrolcü saat
+    # bile okumaz
+    # -------------------------------------------------------------------------
+
+    def _compute_p(self, error: float, measurement: float = None) -> float:
+        """Saf P varyantı: zaman/durum yok, çarp ve sınırla."""
+        if self.reverse:
+            error = -error
+
+        output = self.kp * error
+        if output > self.output_max:
+            output = self.output_max
+        elif output < self.output_min:
+            output = self.output_min
+
+        self._prev_error = error
+        return output
+
+    def _compute_pi(self, error: float, measurement: float = None) -> float:
+        """PI varyantı: türev yolu ve ölçüm takibi atılmıştır."""
+        now_ns = time.monotonic_ns()
+
+        if self._last_time_ns == 0:
+            dt = self.sample_time if self.sample_time else 0.05
+            self._first_run = True
+        else:
+            dt_ns = now_ns - self._last_time_ns
+            dt = dt_ns * 1e-9 if dt_ns > 0 else 0.001
+
+        self._last_time_ns = now_ns
+
+        if self.reverse:
+            error = -error
+
+        if self._first_run:
+            self._prev_error = error
+
+        output, self._integral = _pid_step(
+            self.kp, self.ki, 0.0, self.kt,
+            error, self._prev_error, 0.0,
+            self._integral, dt,
+            self.output_min, self.output_max)
+
+        self._prev_error = error
+        self._first_run = False
+        return output
+
+    def _compute_pd(self, error: float, measurement: float = None) -> float:
+        """PD varyantı: integral biriktirme ve anti-windup atılmıştır."""
+        now_ns = time.monotonic_ns()
+
+        if self._last_time_ns == 0:
+            dt = self.sample_time if self.sample_time else 0.05
+            self._first_run = True
+        else:
+            dt_ns = now_ns - self._last_time_ns
+            dt = dt_ns * 1e-9 if dt_ns > 0 else 0.001
+
+        self._last_time_ns = now_ns
+
+        if self.reverse:
+            error = -error
+
+        if measurement is None:
+            measurement = -error
+
+        if self._first_run:
+            d_error = 0.0
             self._prev_measurement = measurement
+        else:
+            d_error = -(measurement - self._prev_measurement) * (1.0 / dt)
+
+        output = self.kp * error + self.kd * d_error
+        if output > self.output_max:
+            output = self.output_max
+        elif output < self.output_min:
+            output = self.output_min
+
+        self._prev_error = error
+        self._prev_measurement = measurement
         self._first_run = False
-        
-        # ---------------------------------------------------------------------
-        # TOPLAM ÇIKIŞ
-        # ---------------------------------------------------------------------
-        output = p_term + i_term + d_term
-        
-        # Output sınırlama
-        output = self._clamp(output, self.output_min, self.output_max)
-        
         return output
-    
+
+    def _mk_compute(self):
+        """Sıfır olmayan kazançlara göre uygun compute varyantını seç."""
+        if self.ki == 0.0 and self.kd == 0.0:
+            return self._compute_p
+        if self.kd == 0.0:
+            return self._compute_pi
+        if self.ki == 0.0:
+            return self._compute_pd
+        return self._compute_pid
+
     # =========================================================================
     # CONFIGURATION
     # =========================================================================
@@ -222,9 +438,19 @@ class PIDController:
             self.ki = ki
         if kd is not None:
             self.kd = kd
-        
-        self._logger.debug(f"{self.name} kazançları güncellendi: "
-                          f"Kp={self.kp}, Ki={self.ki}, Kd={self.kd}")
+
+        # Türetilmiş izleme kazancını yeni kazançlarla tazele (elle
+        # verilmiş kt korunur) - aksi halde Ki sonradan açıldığında
+        # bayat kt ile back-calculation koşardı
+        if not self._kt_fixed:
+            self.kt = self._derived_kt(self.ki, self.kd)
+
+        # Kazançlar sıfırı geçmiş olabilir - varyantı yeniden bağla
+        self.compute = self._mk_compute()
+
+        # %-stili: logging argümanları yalnızca DEBUG etkinse biçimler
+        self._logger.debug("%s kazançları güncellendi: Kp=%s, Ki=%s, Kd=%s",
+                           self.name, self.kp, self.ki, self.kd)
     
     def set_output_limits(self, output_min: float, output_max: float):
         """
@@ -276,11 +502,11 @@ class PIDController:
         """
         self._integral = 0.0
         self._prev_error = 0.0
-        self._prev_measurement = None
-        self._last_time = None
+        self._prev_measurement = 0.0
+        self._last_time_ns = 0
         self._first_run = True
         
-        self._logger.debug(f"{self.name} sıfırlandı")
+        self._logger.debug("%s sıfırlandı", self.name)
     
     def reset_integral(self):
         """
@@ -289,41 +515,30 @@ class PIDController:
         Wind-up durumunda kullanılabilir.
         """
         self._integral = 0.0
-        self._logger.debug(f"{self.name} integral sıfırlandı")
+        self._logger.debug("%s integral sıfırlandı", self.name)
     
     # =========================================================================
     # UTILITY
     # =========================================================================
     
-    @staticmethod
-    def _clamp(value: float, min_val: float, max_val: float) -> float:
-        """
-        Değeri belirli aralıkta sınırla.
-        
-        Args:
-            value: Sınırlanacak değer
-            min_val: Minimum değer
-            max_val: Maksimum değer
-        
-        Returns:
-            float: Sınırlanmış değer
-        """
-        return max(min_val, min(max_val, value))
-    
     def get_terms(self) -> dict:
         """
         PID terimlerinin son değerlerini al (debug için).
-        
+
         Returns:
             dict: {'p': p_term, 'i': i_term, 'd': d_term}
+
+        Note:
+            Dönen sözlük çağrılar arasında yeniden kullanılır - saklamak
+            isteyen çağıran kopyalamalıdır (dict(terms))
         """
-        return {
-            'p': self.kp * self._prev_error,
-            'i': self.ki * self._integral,
-            'd': 0.0,  # D terimi kaydedilmiyor, anlık hesaplanıyor
-            'integral': self._integral,
-            'error': self._prev_error
-        }
+        buf = self._terms_buf
+        buf['p'] = self.kp * self._prev_error
+        buf['i'] = self.ki * self._integral
+        buf['d'] = 0.0  # D terimi kaydedilmiyor, anlık hesaplanıyor
+        buf['integral'] = self._integral
+        buf['error'] = self._prev_error
+        return buf
     
     def __repr__(self) -> str:
         """String representation."""
@@ -331,22 +546,168 @@ class PIDController:
                 f"kd={self.kd}, limits=[{self.output_min}, {self.output_max}])")
 
 
+# =============================================================================
+# PID BANK (çok eksenli vektörize PID)
+# =============================================================================
+
+class PIDBank:
+    """
+    N bağımsız PID döngüsünü tek vektörize compute() ile güncelleyen
+    SoA (structure-of-arrays) kontrolcü bankası.
+
+    x/y/yaw/throttle gibi kilit adımda (lockstep) güncellenen eksenler
+    için N ayrı PIDController.compute() çağrısı yerine kazançlar ve
+    durumlar uzunluk-N numpy dizilerinde tutulur; her tick tek
+    interpreter geçişinde tüm eksenler hesaplanır. Aritmetik skaler
+    PIDController ile aynıdır: trapez integrasyon + back-calculation
+    anti-windup.
+
+    Example:
+        >>> bank = PIDBank(kps=[0.8, 0.8], kis=[0.1, 0.1],
+        ...                kds=[0.3, 0.3])
+        >>> outputs = bank.compute(np.array([err_x, err_y]))
+    """
+
+    def __init__(self, kps: Sequence[float], kis: Sequence[float],
+                 kds: Sequence[float],
+                 output_min: float = -1.0, output_max: float = 1.0,
+                 kts: Sequence[float] = None):
+        """
+        PID bankası oluştur.
+
+        Args:
+            kps: Eksen başına Kp kazançları
+            kis: Eksen başına Ki kazançları
+            kds: Eksen başına Kd kazançları
+            output_min: Minimum çıkış (tüm eksenler)
+            output_max: Maksimum çıkış (tüm eksenler)
+            kts: Back-calculation kazançları (None ise Åström kuralı)
+        """
+        self.kp = np.asarray(kps, dtype=np.float64)
+        self.ki = np.asarray(kis, dtype=np.float64)
+        self.kd = np.asarray(kds, dtype=np.float64)
+
+        self.output_min = output_min
+        self.output_max = output_max
+
+        # Åström kuralı eksen başına: sqrt(|ki/kd|), kd=0 ise 1/|ki|,
+        # ki=0 ise 0 (integratör etkisiz - izleme kazancı anlamsız)
+        if kts is not None:
+            self.kt = np.asarray(kts, dtype=np.float64)
+        else:
+            self.kt = np.where(
+                self.ki != 0.0,
+                np.where(
+                    self.kd != 0.0,
+                    np.sqrt(np.abs(self.ki / np.where(self.kd != 0.0,
+                                                      self.kd, 1.0))),
+                    1.0 / np.abs(np.where(self.ki != 0.0,
+                                          self.ki, 1.0))),
+                0.0)
+
+        n = len(self.kp)
+        self.integrals = np.zeros(n)
+        self.prev_errors = np.zeros(n)
+
+        # Önceden tahsisli ara diziler: compute() tick başına yeni
+        # dizi üretmez
+        self._unsat = np.empty(n)
+        self._out = np.empty(n)
+        self._scratch = np.empty(n)
+
+        self._last_time_ns = 0
+        self._first_run = True
+
+    def compute(self, errors: np.ndarray) -> np.ndarray:
+        """
+        Tüm eksenlerin PID çıkışlarını tek geçişte hesapla.
+
+        Args:
+            errors: Eksen başına hata değerleri (uzunluk N)
+
+        Returns:
+            np.ndarray: Sınırlanmış çıkışlar (çağrılar arasında
+                        yeniden kullanılan tampon - kopyalamadan sonra
+                        saklanmamalı)
+        """
+        now_ns = time.monotonic_ns()
+
+        if self._last_time_ns == 0:
+            dt = 0.05
+        else:
+            dt_ns = now_ns - self._last_time_ns
+            dt = dt_ns * 1e-9 if dt_ns > 0 else 0.001
+
+        self._last_time_ns = now_ns
+
+        if self._first_run:
+            np.copyto(self.prev_errors, errors)
+            self._first_run = False
+
+        inv_dt = 1.0 / dt
+        unsat = self._unsat
+        out = self._out
+        scratch = self._scratch
+
+        # u = kp*e + ki*integ + kd*(e - e_prev)/dt  (tek vektör geçişi,
+        # ara tamponlar yerinde kullanılır)
+        np.subtract(errors, self.prev_errors, out=scratch)
+        scratch *= inv_dt
+        scratch *= self.kd
+        np.multiply(self.kp, errors, out=unsat)
+        unsat += self.ki * self.integrals
+        unsat += scratch
+
+        np.clip(unsat, self.output_min, self.output_max, out=out)
+
+        # Trapez integrasyon + back-calculation (skalerle aynı form)
+        np.subtract(out, unsat, out=scratch)
+        scratch *= self.kt
+        scratch += 0.5 * (errors + self.prev_errors)
+        scratch *= dt
+        self.integrals += scratch
+
+        np.copyto(self.prev_errors, errors)
+
+        return out
+
+    def reset(self):
+        """Tüm eksenlerin integral/önceki-hata durumlarını sıfırla."""
+        self.integrals.fill(0.0)
+        self.prev_errors.fill(0.0)
+        self._last_time_ns = 0
+        self._first_run = True
+
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def tune_pid_ziegler_nichols(ku: float, tu: float, controller_type: str = 'PID') -> dict:
+class PIDGains(NamedTuple):
+    """
+    PID kazanç üçlüsü.
+
+    Sözlük yerine C destekli sabit boyutlu tuple: otomatik ayar
+    döngüsünde çağrı başına hash tablosu tahsis edilmez, alan erişimi
+    gains.kp biçiminde.
+    """
+    kp: float
+    ki: float
+    kd: float
+
+
+def tune_pid_ziegler_nichols(ku: float, tu: float, controller_type: str = 'PID') -> PIDGains:
     """
     Ziegler-Nichols yöntemi ile PID kazançlarını hesapla.
-    
+
     Args:
         ku: Ultimate gain (salınım başladığı Kp değeri)
         tu: Ultimate period (salınım periyodu, saniye)
         controller_type: 'P', 'PI', veya 'PID'
-    
+
     Returns:
-        dict: {'kp': kp, 'ki': ki, 'kd': kd}
-    
+        PIDGains: (kp, ki, kd) kazanç üçlüsü
+
     Note:
         Ziegler-Nichols yöntemi:
         1. Ki ve Kd'yi 0 yap
@@ -355,13 +716,13 @@ def tune_pid_ziegler_nichols(ku: float, tu: float, controller_type: str = 'PID')
         4. Aşağıdaki formülleri kullan
     """
     if controller_type == 'P':
-        return {'kp': 0.5 * ku, 'ki': 0.0, 'kd': 0.0}
-    
+        return PIDGains(kp=0.5 * ku, ki=0.0, kd=0.0)
+
     elif controller_type == 'PI':
-        return {'kp': 0.45 * ku, 'ki': 0.54 * ku / tu, 'kd': 0.0}
-    
+        return PIDGains(kp=0.45 * ku, ki=0.54 * ku / tu, kd=0.0)
+
     elif controller_type == 'PID':
-        return {'kp': 0.6 * ku, 'ki': 1.2 * ku / tu, 'kd': 0.075 * ku * tu}
+        return PIDGains(kp=0.6 * ku, ki=1.2 * ku / tu, kd=0.075 * ku * tu)
     
     else:
         raise ValueError(f"Unknown controller type: {controller_type}")
@@ -54,15 +54,28 @@ Geçişler (Transitions):
 import time
 import logging
 import threading
-from enum import Enum, auto
-from typing import Optional, Tuple, Callable
+from enum import IntEnum, auto
+from typing import NamedTuple, Optional, Tuple, Callable
 
+import numpy as np
 
-class SystemState(Enum):
+# Numba import (opsiyonel - yoksa saf Python çekirdek kullanılır)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+class SystemState(IntEnum):
     """
     Sistem durumları.
-    
+
     Her durum sistemin farklı bir davranış modunu temsil eder.
+    IntEnum: eşitlik karşılaştırmaları Enum.__eq__ yerine C düzeyinde
+    tamsayı karşılaştırmasıyla koşar - update() ve getter'larda frame
+    başına onlarca kez yapılır. Sayısal değerler telemetri kablosuna
+    (WS u8) çıktığından sıralama korunur.
     """
     IDLE = auto()       # Pasif, beklemede
     SEARCHING = auto()  # Lazer aranıyor
@@ -73,6 +86,144 @@ class SystemState(Enum):
     COMPLETE = auto()   # İniş tamamlandı
 
 
+# =============================================================================
+# GEÇİŞ ÇEKİRDEĞİ
+# =============================================================================
+
+# Çekirdek için düz int sabitleri: njit altında IntEnum üye erişimi
+# yerine C tamsayı karşılaştırması
+_ST_IDLE = int(SystemState.IDLE)
+_ST_SEARCHING = int(SystemState.SEARCHING)
+_ST_TRACKING = int(SystemState.TRACKING)
+_ST_APPROACH = int(SystemState.APPROACH)
+_ST_LANDING = int(SystemState.LANDING)
+_ST_LOST = int(SystemState.LOST)
+_ST_COMPLETE = int(SystemState.COMPLETE)
+
+
+# Olay bitleri: girdiler tek tamsayıya paketlenir, geçiş tablo
+# aramasına iner
+_EVT_LASER = 1    # Lazer görünüyor
+_EVT_CONFIRM = 2  # Onay süresi doldu (now >= detect_deadline)
+_EVT_LOST_TO = 4  # Kayıp süresi doldu (now >= lost_deadline)
+_EVT_LAND_H = 8   # Yükseklik <= landing_height
+_EVT_TOUCH = 16   # Yere temas (yükseklik <= 0.1)
+
+
+def _build_next_state() -> np.ndarray:
+    """
+    (durum, olay) → yeni durum arama tablosu kur (-1: geçiş yok).
+
+    if/elif merdiveni yerine tek indeksli yükleme: düzensiz durum
+    dizilerinde dal tahmin kaçağı yok, derlenmiş çekirdekte yükleme +
+    karşılaştırmaya iner. 8 durum x 32 olay = 256 bayt, L1'e sığar.
+    """
+    table = np.full((8, 32), -1, dtype=np.int8)
+    for evt in range(32):
+        laser = bool(evt & _EVT_LASER)
+        confirm = bool(evt & _EVT_CONFIRM)
+        lost_to = bool(evt & _EVT_LOST_TO)
+        land_h = bool(evt & _EVT_LAND_H)
+        touch = bool(evt & _EVT_TOUCH)
+
+        if laser:
+            table[_ST_SEARCHING, evt] = _ST_TRACKING
+            table[_ST_LOST, evt] = _ST_TRACKING
+            if confirm:
+                table[_ST_TRACKING, evt] = _ST_APPROACH
+            if land_h:
+                table[_ST_APPROACH, evt] = _ST_LANDING
+        else:
+            table[_ST_TRACKING, evt] = _ST_SEARCHING
+            if lost_to:
+                table[_ST_APPROACH, evt] = _ST_LOST
+
+        # LANDING: temas → COMPLETE, ama eşzamanlı kayıp LOST kazanır
+        if touch:
+            table[_ST_LANDING, evt] = _ST_COMPLETE
+        if not laser and lost_to:
+            table[_ST_LANDING, evt] = _ST_LOST
+    return table
+
+
+_NEXT_STATE = _build_next_state()
+
+
+def _fsm_step(state: int, laser: bool, altitude: float, now: float,
+              detect_deadline: float, lost_deadline: float,
+              landing_height: float) -> int:
+    """
+    Durum geçiş kararı - yalnız skalerler üzerinde saf fonksiyon.
+
+    Girdi predikatları tek olay tamsayısına paketlenir, yeni durum
+    _NEXT_STATE tablosundan okunur. Yan etkisizdir: loglama, callback
+    ve zamanlayıcı tohumlama _process_state sarmalayıcısında kalır.
+    Numba varsa njit ile makine koduna derlenir (cache=True: derleme
+    tek seferlik, diskte saklanır).
+
+    Returns:
+        int: Yeni durum kimliği (geçiş yoksa state'in kendisi)
+    """
+    evt = ((_EVT_LASER if laser else 0)
+           | (_EVT_CONFIRM if now >= detect_deadline else 0)
+           | (_EVT_LOST_TO if now >= lost_deadline else 0)
+           | (_EVT_LAND_H if altitude <= landing_height else 0)
+           | (_EVT_TOUCH if altitude <= 0.1 else 0))
+    nxt = _NEXT_STATE[state, evt]
+    if nxt < 0:
+        return state
+    return int(nxt)
+
+
+# Saf Python sürümüne referans: aot_build.py derleme kaynağı olarak
+# bunu kullanır (aşağıdaki njit/AOT/C-ext atamaları _fsm_step'in
+# üstüne yazar)
+_fsm_step_py = _fsm_step
+
+if NUMBA_AVAILABLE:
+    _fsm_step = njit(cache=True)(_fsm_step)
+    # Isındırma: ilk gerçek frame derleme bekletmesin
+    _fsm_step(_ST_IDLE, False, 0.0, 0.0, 0.0, 0.0, 0.8)
+
+# AOT derlenmiş çekirdek (opsiyonel): aot_build.py ile üretilen
+# state_machine_aot*.so varsa JIT ısınması tamamen atlanır - açılış
+# maliyeti derleme yerine .so yüklemesi kadardır
+try:
+    from state_machine_aot import fsm_step as _fsm_step  # noqa: F811
+    FSM_AOT_AVAILABLE = True
+except ImportError:
+    FSM_AOT_AVAILABLE = False
+
+# Derlenmiş çekirdek (opsiyonel): Cython/C ile derlenmiş bir
+# fsm_step(state, laser, altitude, now, detect_deadline,
+# lost_deadline, landing_height) -> int kurulmuşsa numba/Python
+# sürümünün yerine geçer - JIT ısınması ve çağrı sarmalaması olmadan
+# düz C fonksiyonu
+try:
+    from _fsm_core import fsm_step as _fsm_step  # noqa: F811
+    FSM_CORE_AVAILABLE = True
+except ImportError:
+    FSM_CORE_AVAILABLE = False
+
+
+class StateInfo(NamedTuple):
+    """
+    get_state_info() anlık görüntüsü.
+
+    dict yerine NamedTuple: kurulum tek C tahsisi (hash tablosu
+    doldurma yok), alan erişimi indeks yüklemesi, kopya ~56B.
+    Kontrol döngüsünde her frame üretildiğinden fark birikir.
+    """
+    state: str
+    prev_state: str
+    state_duration: float
+    laser_detected: bool
+    laser_position: Optional[Tuple[int, int]]
+    altitude: float
+    laser_visible_time: float
+    laser_lost_time: float
+
+
 class StateMachine:
     """
     Finite State Machine (FSM) sınıfı.
@@ -91,11 +242,22 @@ class StateMachine:
         >>> fsm.update(laser_detected=True, laser_position=(320, 240), altitude=10.0)
         >>> print(fsm.get_state())
     """
-    
+
+    # __slots__: durum alanları __dict__ yerine C dizisi ofsetlerinde -
+    # update() ve getter'lardaki her self._state erişimi ucuzlar
+    __slots__ = ('detection_time', 'lost_timeout',
+                 'start_height', 'landing_height',
+                 '_state', '_prev_state',
+                 '_laser_first_seen', '_laser_last_seen', '_laser_seen',
+                 '_detect_deadline', '_lost_deadline',
+                 '_state_enter_time', '_laser_position', '_altitude',
+                 '_on_state_change', '_lock', '_seq', '_clock', '_logger')
+
     def __init__(self, detection_time: float = 2.0,
                  lost_timeout: float = 3.0,
                  start_height: float = 15.0,
-                 landing_height: float = 0.8):
+                 landing_height: float = 0.8,
+                 clock: Callable[[], float] = None):
         """
         State machine oluştur.
         
@@ -106,12 +268,18 @@ class StateMachine:
                          Lazer bu süre görülmezse LOST durumuna geç
             start_height: Precision landing başlama yüksekliği (metre)
             landing_height: Final landing yüksekliği (metre)
+            clock: Zaman kaynağı (None ise time.monotonic). Test/
+                   simülasyonda sanal saat enjekte edilebilir -
+                   sleep'le beklemek yerine saat ileri sarılır
         """
         # Parametreler
         self.detection_time = detection_time
         self.lost_timeout = lost_timeout
         self.start_height = start_height
         self.landing_height = landing_height
+
+        # Zaman kaynağı: tüm iç zaman okumaları buradan geçer
+        self._clock = clock if clock is not None else time.monotonic
         
         # Mevcut durum
         self._state = SystemState.IDLE
@@ -120,7 +288,14 @@ class StateMachine:
         # Zamanlayıcılar
         self._laser_first_seen = 0.0      # Lazer ilk görüldüğü zaman
         self._laser_last_seen = 0.0       # Lazer son görüldüğü zaman
+        self._laser_seen = False          # Lazer hiç görüldü mü?
         self._state_enter_time = 0.0      # Duruma giriş zamanı
+
+        # Mutlak son tarihler: her frame "now - görülme >= süre" farkı
+        # yerine bir kez "görülme + süre" hesaplanır, tick'te tek
+        # karşılaştırma kalır
+        self._detect_deadline = 0.0       # Lazer onayının dolacağı an
+        self._lost_deadline = 0.0         # Kayıp sayılacağı an
         
         # Lazer pozisyonu
         self._laser_position: Optional[Tuple[int, int]] = None
@@ -130,9 +305,15 @@ class StateMachine:
         
         # Callback fonksiyonları
         self._on_state_change: Optional[Callable] = None
-        
-        # Thread safety
+
+        # Thread safety: kilit yalnızca YAZARLARI (update/enable/
+        # disable) sıralar. Okuyucular kilit almaz - tekil alan
+        # okumaları GIL altında zaten atomiktir, çok alanlı anlık
+        # görüntüler ise seqlock ile alınır: yazar güncellemeden önce
+        # ve sonra _seq'i artırır (güncelleme sürerken tek sayı),
+        # okuyucu sayaç değişmediyse tutarlı okuduğunu bilir
         self._lock = threading.Lock()
+        self._seq = 0
         
         # Logger
         self._logger = logging.getLogger(__name__)
@@ -144,73 +325,95 @@ class StateMachine:
     def get_state(self) -> SystemState:
         """
         Mevcut durumu al.
-        
+
         Returns:
             SystemState: Mevcut durum
         """
-        with self._lock:
-            return self._state
-    
+        # Tek referans okuması GIL altında atomik - kilit gereksiz
+        return self._state
+
     def get_state_name(self) -> str:
         """
         Mevcut durum adını al.
-        
+
         Returns:
             str: Durum adı
         """
-        with self._lock:
-            return self._state.name
-    
-    def get_state_info(self) -> dict:
+        return self._state.name
+
+    def get_state_info(self, now: float = None) -> StateInfo:
         """
-        Durum bilgilerini al.
-        
+        Durum bilgilerini al (kilitsiz, seqlock ile tutarlı).
+
+        Args:
+            now: Önbelleklenmiş time.monotonic() değeri (None ise
+                 burada okunur) - frame başına tek saat okuması yeter
+
         Returns:
-            dict: Durum detayları
-        """
-        with self._lock:
-            now = time.time()
-            
-            return {
-                'state': self._state.name,
-                'prev_state': self._prev_state.name,
-                'state_duration': now - self._state_enter_time,
-                'laser_detected': self._laser_position is not None,
-                'laser_position': self._laser_position,
-                'altitude': self._altitude,
-                'laser_visible_time': (now - self._laser_first_seen 
-                                       if self._laser_first_seen > 0 else 0),
-                'laser_lost_time': (now - self._laser_last_seen 
-                                   if self._laser_last_seen > 0 else 0)
-            }
+            StateInfo: Durum detayları (alan adlarıyla erişilir;
+                       JSON gerekiyorsa info._asdict())
+        """
+        # Seqlock okuma: sayaç okuma öncesi/sonrası aynı ve çiftse
+        # alanlar yırtılmadan (torn read) okunmuştur; değilse yazar
+        # araya girmiştir, yeniden dene
+        while True:
+            s1 = self._seq
+            state = self._state
+            prev_state = self._prev_state
+            enter_time = self._state_enter_time
+            laser_pos = self._laser_position
+            altitude = self._altitude
+            first_seen = self._laser_first_seen
+            last_seen = self._laser_last_seen
+            laser_seen = self._laser_seen
+            if s1 == self._seq and not (s1 & 1):
+                break
+
+        if now is None:
+            now = self._clock()
+
+        return StateInfo(
+            state=state.name,
+            prev_state=prev_state.name,
+            state_duration=now - enter_time,
+            laser_detected=laser_pos is not None,
+            laser_position=laser_pos,
+            altitude=altitude,
+            laser_visible_time=(now - first_seen
+                                if laser_seen else 0),
+            laser_lost_time=(now - last_seen
+                             if last_seen > 0 else 0)
+        )
     
     # =========================================================================
     # STATE TRANSITIONS
     # =========================================================================
     
-    def _change_state(self, new_state: SystemState):
+    def _change_state(self, new_state: SystemState, now: float = None):
         """
         Durumu değiştir.
-        
+
         Args:
             new_state: Yeni durum
+            now: Önbelleklenmiş time.monotonic() değeri (opsiyonel)
         """
         if new_state == self._state:
             return
-        
+
         old_state = self._state
         self._prev_state = old_state
         self._state = new_state
-        self._state_enter_time = time.time()
+        self._state_enter_time = now if now is not None else self._clock()
         
-        self._logger.info(f"🔄 Durum değişti: {old_state.name} → {new_state.name}")
+        self._logger.info("🔄 Durum değişti: %s → %s",
+                          old_state.name, new_state.name)
         
         # Callback çağır
         if self._on_state_change:
             try:
                 self._on_state_change(old_state, new_state)
             except Exception as e:
-                self._logger.error(f"State change callback hatası: {e}")
+                self._logger.error("State change callback hatası: %s", e)
     
     def enable(self):
         """
@@ -220,8 +423,10 @@ class StateMachine:
         """
         with self._lock:
             if self._state == SystemState.IDLE:
+                self._seq += 1
                 self._reset_timers()
                 self._change_state(SystemState.SEARCHING)
+                self._seq += 1
                 self._logger.info("✅ Sistem aktif edildi")
     
     def disable(self):
@@ -231,8 +436,10 @@ class StateMachine:
         Herhangi bir durumdan → IDLE geçişi yapar.
         """
         with self._lock:
+            self._seq += 1
             self._reset_timers()
             self._change_state(SystemState.IDLE)
+            self._seq += 1
             self._logger.info("⏹️ Sistem durduruldu")
     
     def _reset_timers(self):
@@ -241,134 +448,205 @@ class StateMachine:
         """
         self._laser_first_seen = 0.0
         self._laser_last_seen = 0.0
+        self._laser_seen = False
+        self._detect_deadline = 0.0
+        self._lost_deadline = 0.0
         self._laser_position = None
     
     # =========================================================================
     # UPDATE
     # =========================================================================
     
-    def update(self, laser_detected: bool, 
+    def update(self, laser_detected: bool,
                laser_position: Optional[Tuple[int, int]] = None,
-               altitude: float = 0.0):
+               altitude: float = 0.0,
+               now: float = None):
         """
         Durumu güncelle.
-        
+
         Her frame'de çağrılmalı.
-        
+
         Args:
             laser_detected: Lazer tespit edildi mi?
             laser_position: Lazer pozisyonu (x, y) veya None
             altitude: Mevcut yükseklik (metre)
+            now: Önbelleklenmiş time.monotonic() değeri - çağıran
+                 frame başına bir kez okuyup buraya geçirebilir
         """
         with self._lock:
-            now = time.time()
-            
+            if now is None:
+                now = self._clock()
+
+            # Seqlock yazma penceresi: sayaç tek iken okuyucular retry
+            # eder
+            self._seq += 1
+
             # Değerleri güncelle
             self._altitude = altitude
             if laser_detected:
                 self._laser_position = laser_position
                 self._laser_last_seen = now
-                
-                # İlk görülme zamanı
-                if self._laser_first_seen == 0:
+                self._lost_deadline = now + self.lost_timeout
+
+                # İlk görülme zamanı (bool bayrak: her frame float
+                # karşılaştırması yerine tek bool yüklemesi)
+                if not self._laser_seen:
                     self._laser_first_seen = now
+                    self._laser_seen = True
+                    self._detect_deadline = now + self.detection_time
             else:
                 self._laser_position = None
             
             # Durum makinesini işle
             self._process_state(laser_detected, now)
-    
+
+            self._seq += 1
+
+    def update_batch(self, laser_detected: np.ndarray,
+                     positions: Optional[np.ndarray],
+                     altitudes: np.ndarray,
+                     dt: float):
+        """
+        Bir tick dizisini toplu işle (simülasyon/replay için).
+
+        Tick başına Python'dan update() çağırmak yerine olay tick'leri
+        NumPy ile önden bulunur ve FSM yalnızca onlarda güncellenir:
+        lazer görünürlüğünün değiştiği kenarlar, yükseklik eşiği
+        geçişleri (start/landing/temas) ve aktif son tarihin düştüğü
+        tick. Durum değişmediği sürece aradaki tick'lerde de
+        değişemeyeceği kanıtlıdır; bir geçiş OLDUĞUNDA ise zincirleme
+        geçişler (örn. onay dolduğunda yükseklik eşiği çoktan
+        geçilmişse) aday listesinde görünmez - bu yüzden geçişten
+        hemen sonraki tick her zaman işlenir, tick-tick update()
+        semantiği korunur. N adım yerine O(olay sayısı) update()
+        çağrısı kalır.
+
+        Args:
+            laser_detected: Tick başına tespit bayrağı, shape (N,)
+            positions: Tick başına (x, y) pozisyon, shape (N, 2)
+                       veya None
+            altitudes: Tick başına yükseklik (metre), shape (N,)
+            dt: Tick'ler arası süre (saniye)
+        """
+        laser_detected = np.asarray(laser_detected, dtype=bool)
+        altitudes = np.asarray(altitudes, dtype=np.float64)
+        n = altitudes.shape[0]
+        if n == 0:
+            return
+
+        t0 = self._clock()
+
+        # Aday tick'ler: görünürlük kenarları (kenarın kendisi VE bir
+        # öncesi - son tarih son görülen tick'ten hesaplanır), ilk
+        # eşik geçişleri ve uçlar
+        candidates = {0, n - 1}
+        edges = np.flatnonzero(laser_detected[1:] != laser_detected[:-1]) + 1
+        for e in edges:
+            candidates.add(int(e))
+            candidates.add(int(e) - 1)
+        for thresh in (self.start_height, self.landing_height, 0.1):
+            # HER aşağı geçiş adaydır, yalnız ilki değil: araç eşiğin
+            # altına erken dalıp çıkar ve APPROACH'a girdikten sonra
+            # yeniden geçerse LANDING/COMPLETE ikinci geçişte tetiklenir
+            # (tick 0 zaten adaydır - başlangıçta eşik altı olma durumu
+            # örtülü kapsanır)
+            cross = np.flatnonzero((altitudes[1:] <= thresh)
+                                   & (altitudes[:-1] > thresh)) + 1
+            candidates.update(cross.tolist())
+        pending = sorted(candidates)
+
+        i = 0
+        while i < n:
+            det = bool(laser_detected[i])
+            pos = None
+            if det and positions is not None:
+                pos = (int(positions[i][0]), int(positions[i][1]))
+            prev_state = self._state
+            self.update(det, pos, float(altitudes[i]), now=t0 + i * dt)
+
+            # Geçiş olduysa zincirin devamı (örn. APPROACH'a girerken
+            # landing eşiği çoktan aşılmışsa LANDING) bir SONRAKİ
+            # tick'te düşebilir ve aday listesinde olmayabilir -
+            # state_enter_time/callback zamanlaması kaymasın diye o
+            # tick'i atlamadan işle
+            if self._state != prev_state:
+                i += 1
+                continue
+
+            # Sıradaki aday: olay listesi + (varsa) aktif son tarihin
+            # düştüğü tick - t0 + k*dt >= deadline olan ilk k
+            next_i = n
+            for j in pending:
+                if j > i:
+                    next_i = j
+                    break
+            state = self._state
+            deadline = None
+            if state == SystemState.TRACKING and det:
+                deadline = self._detect_deadline
+            elif not det and (state == SystemState.APPROACH or
+                              state == SystemState.LANDING):
+                deadline = self._lost_deadline
+            if deadline is not None:
+                k = -int(-(deadline - t0) // dt)
+                # Kayan nokta hizalaması: k, update()'teki
+                # "now >= deadline" karşılaştırmasının GERÇEKTEN ilk
+                # doğru olduğu tick olmalı - ceil aritmetiği float
+                # yuvarlamasıyla bir tick kayabilir
+                while k > i + 1 and t0 + (k - 1) * dt >= deadline:
+                    k -= 1
+                while t0 + k * dt < deadline:
+                    k += 1
+                if i < k < next_i:
+                    next_i = k
+            i = next_i
+
     def _process_state(self, laser_detected: bool, now: float):
         """
         Durum mantığını işle.
-        
+
+        Geçiş kararı modül düzeyindeki _fsm_step çekirdeğinde alınır
+        (numba varsa derlenmiş): frame başına tek çağrı, içinde yalnız
+        skaler karşılaştırmalar. Geçişe bağlı yan etkiler - log,
+        zamanlayıcı tohumlama, callback - burada Python tarafında,
+        yalnız durum GERÇEKTEN değişirken koşar.
+
         Args:
             laser_detected: Lazer tespit edildi mi?
             now: Şimdiki zaman
         """
         state = self._state
-        
-        # -----------------------------------------------------------------
-        # IDLE: Pasif durumda bekle
-        # -----------------------------------------------------------------
-        if state == SystemState.IDLE:
-            # enable() ile aktif edilene kadar bekle
-            pass
-        
-        # -----------------------------------------------------------------
-        # SEARCHING: Lazer ara
-        # -----------------------------------------------------------------
-        elif state == SystemState.SEARCHING:
-            if laser_detected:
-                # Lazer bulundu → TRACKING
-                self._change_state(SystemState.TRACKING)
-        
-        # -----------------------------------------------------------------
-        # TRACKING: Lazer onayı bekle
-        # -----------------------------------------------------------------
-        elif state == SystemState.TRACKING:
-            if not laser_detected:
-                # Lazer kayboldu → Tekrar aramaya dön
-                self._reset_timers()
-                self._change_state(SystemState.SEARCHING)
-            
-            elif now - self._laser_first_seen >= self.detection_time:
-                # Lazer yeterince uzun süre görüldü → APPROACH
-                self._logger.info(f"✅ Lazer onaylandı ({self.detection_time}s)")
-                self._change_state(SystemState.APPROACH)
-        
-        # -----------------------------------------------------------------
-        # APPROACH: Lazere doğru yaklaş
-        # -----------------------------------------------------------------
-        elif state == SystemState.APPROACH:
-            if laser_detected:
-                # Lazer görünüyor, yüksekliği kontrol et
-                if self._altitude <= self.landing_height:
-                    # Yeterince alçaldı → LANDING
-                    self._logger.info(f"🛬 Final iniş yüksekliği ({self.landing_height}m)")
-                    self._change_state(SystemState.LANDING)
-            
+        new_id = _fsm_step(int(state), laser_detected, self._altitude, now,
+                           self._detect_deadline, self._lost_deadline,
+                           self.landing_height)
+        if new_id == state:
+            return
+
+        new_state = SystemState(new_id)
+
+        # Geçişe özgü yan etkiler
+        if new_state == SystemState.SEARCHING:
+            # TRACKING'de lazer kaçtı → aramaya temiz başla
+            self._reset_timers()
+        elif new_state == SystemState.APPROACH:
+            self._logger.info("✅ Lazer onaylandı (%ss)", self.detection_time)
+        elif new_state == SystemState.LANDING:
+            self._logger.info("🛬 Final iniş yüksekliği (%sm)",
+                              self.landing_height)
+        elif new_state == SystemState.LOST:
+            if state == SystemState.LANDING:
+                self._logger.warning("⚠️ Final inişte lazer kayıp!")
             else:
-                # Lazer kayıp - timeout kontrolü
-                lost_duration = now - self._laser_last_seen
-                
-                if lost_duration >= self.lost_timeout:
-                    # Çok uzun süre kayıp → LOST
-                    self._logger.warning(f"⚠️ Lazer kayıp ({self.lost_timeout}s)")
-                    self._change_state(SystemState.LOST)
-        
-        # -----------------------------------------------------------------
-        # LANDING: Final iniş
-        # -----------------------------------------------------------------
-        elif state == SystemState.LANDING:
-            # Yere temas kontrolü (şimdilik basit yükseklik kontrolü)
-            if self._altitude <= 0.1:
-                self._logger.info("🎉 İniş tamamlandı!")
-                self._change_state(SystemState.COMPLETE)
-            
-            # Lazer kayıp kontrolü
-            if not laser_detected:
-                lost_duration = now - self._laser_last_seen
-                if lost_duration >= self.lost_timeout:
-                    self._logger.warning("⚠️ Final inişte lazer kayıp!")
-                    self._change_state(SystemState.LOST)
-        
-        # -----------------------------------------------------------------
-        # LOST: Lazer kayıp, bekle veya kurtarma
-        # -----------------------------------------------------------------
-        elif state == SystemState.LOST:
-            if laser_detected:
-                # Lazer tekrar bulundu → TRACKING
-                self._logger.info("🔴 Lazer tekrar bulundu")
-                self._laser_first_seen = now
-                self._change_state(SystemState.TRACKING)
-        
-        # -----------------------------------------------------------------
-        # COMPLETE: İniş tamamlandı
-        # -----------------------------------------------------------------
-        elif state == SystemState.COMPLETE:
-            # Otomatik reset (opsiyonel)
-            pass
+                self._logger.warning("⚠️ Lazer kayıp (%ss)", self.lost_timeout)
+        elif new_state == SystemState.COMPLETE:
+            self._logger.info("🎉 İniş tamamlandı!")
+        elif new_state == SystemState.TRACKING and state == SystemState.LOST:
+            # Kurtarma: onay penceresi baştan başlar
+            self._logger.info("🔴 Lazer tekrar bulundu")
+            self._laser_first_seen = now
+            self._detect_deadline = now + self.detection_time
+
+        self._change_state(new_state, now)
     
     # =========================================================================
     # CALLBACKS
@@ -392,25 +670,29 @@ class StateMachine:
     # UTILITY
     # =========================================================================
     
+    # Predikat bit maskeleri: üyelik testi tek '&' işlemine iner -
+    # tuple/list kurulumu ve eleman eleman eşitlik yok (IntEnum
+    # değerleri doğrudan bit konumu olarak kullanılır)
+    _ACTIVE_MASK = 0xFF & ~(1 << SystemState.IDLE)
+    _TRACK_MASK = (1 << SystemState.TRACKING) | (1 << SystemState.APPROACH)
+
     def is_active(self) -> bool:
         """
         Sistem aktif mi?
-        
+
         Returns:
             bool: IDLE değilse True
         """
-        with self._lock:
-            return self._state != SystemState.IDLE
-    
+        return bool(self._ACTIVE_MASK & (1 << self._state))
+
     def is_tracking(self) -> bool:
         """
         Lazer takip ediliyor mu?
-        
+
         Returns:
             bool: TRACKING veya APPROACH durumundaysa True
         """
-        with self._lock:
-            return self._state in [SystemState.TRACKING, SystemState.APPROACH]
+        return bool(self._TRACK_MASK & (1 << self._state))
     
     def is_landing(self) -> bool:
         """
@@ -419,8 +701,7 @@ class StateMachine:
         Returns:
             bool: LANDING durumundaysa True
         """
-        with self._lock:
-            return self._state == SystemState.LANDING
+        return self._state == SystemState.LANDING
     
     def is_complete(self) -> bool:
         """
@@ -429,20 +710,31 @@ class StateMachine:
         Returns:
             bool: COMPLETE durumundaysa True
         """
-        with self._lock:
-            return self._state == SystemState.COMPLETE
+        return self._state == SystemState.COMPLETE
     
-    def get_laser_tracking_time(self) -> float:
+    def get_laser_tracking_time(self, now: float = None) -> float:
         """
         Lazer ne kadar süredir görülüyor?
-        
+
+        Args:
+            now: Önbelleklenmiş time.monotonic() değeri (opsiyonel)
+
         Returns:
             float: Süre (saniye)
         """
-        with self._lock:
-            if self._laser_first_seen > 0:
-                return time.time() - self._laser_first_seen
-            return 0.0
+        # Seqlock okuma (tek alan ama yazarla yarışta bayat 0 okumasın)
+        while True:
+            s1 = self._seq
+            seen = self._laser_seen
+            first_seen = self._laser_first_seen
+            if s1 == self._seq and not (s1 & 1):
+                break
+
+        if seen:
+            if now is None:
+                now = self._clock()
+            return now - first_seen
+        return 0.0
     
     def __repr__(self) -> str:
         """String representation."""
@@ -457,19 +749,28 @@ if __name__ == '__main__':
     """
     Test script - FSM simülasyonu.
     """
-    logging.basicConfig(level=logging.DEBUG)
-    
+    # WARNING: INFO/DEBUG logları tick başına stderr flush'ı demek -
+    # önemsiz FSM işine karşı baskın maliyet. Geçişler zaten callback
+    # ile basılıyor
+    logging.basicConfig(level=logging.WARNING)
+
     print("State Machine Test")
     print("=" * 50)
     
+    # Sanal saat: sleep ile gerçek zaman beklemek yerine saat ileri
+    # sarılır - ~55 tick'lik senaryo saniyeler yerine mikrosaniyelerde
+    # koşar
+    sim_t = [0.0]
+
     # FSM oluştur
     fsm = StateMachine(
         detection_time=2.0,
         lost_timeout=3.0,
         start_height=15.0,
-        landing_height=0.8
+        landing_height=0.8,
+        clock=lambda: sim_t[0]
     )
-    
+
     # Callback ayarla
     def on_state_change(old_state, new_state):
         print(f"   [CALLBACK] {old_state.name} → {new_state.name}")
@@ -497,40 +798,44 @@ if __name__ == '__main__':
     print("\n[2] Lazer aranıyor...")
     for _ in range(5):
         fsm.update(laser_detected=False, altitude=10.0)
-        time.sleep(0.1)
+        sim_t[0] += 0.1
     print(f"   Durum: {fsm.get_state().name}")
     
+    # Sabit lazer pozisyonu: döngü içinde her tick yeni tuple
+    # ayırmak yerine bir kez ayır, referansla geçir
+    LASER_POS = (320, 240)
+
     # 3. Lazer bulundu
     print("\n[3] Lazer bulundu...")
-    fsm.update(laser_detected=True, laser_position=(320, 240), altitude=10.0)
+    fsm.update(laser_detected=True, laser_position=LASER_POS, altitude=10.0)
     print(f"   Durum: {fsm.get_state().name}")
-    
-    # 4. Onay süresi (2 saniye)
+
+    # 4. Onay süresi (2 saniye) - tick başına print yok, geçişi
+    # callback bildirir
     print("\n[4] Lazer onay süresi bekleniyor (2s)...")
     for i in range(25):
-        fsm.update(laser_detected=True, laser_position=(320, 240), altitude=10.0)
-        time.sleep(0.1)
-        if i % 5 == 0:
-            print(f"   {i/10:.1f}s - Durum: {fsm.get_state().name}")
+        fsm.update(laser_detected=True, laser_position=LASER_POS, altitude=10.0)
+        sim_t[0] += 0.1
+    print(f"   {25 * 0.1:.1f}s - Durum: {fsm.get_state().name}")
     
-    # 5. Yaklaşma (yükseklik azalıyor)
+    # 5. Yaklaşma (yükseklik azalıyor) - tick tick Python döngüsü
+    # yerine tüm iniş profili tek update_batch çağrısıyla
     print("\n[5] Yaklaşma...")
-    altitude = 10.0
-    while altitude > 0.5:
-        altitude -= 0.3
-        fsm.update(laser_detected=True, laser_position=(320, 240), altitude=altitude)
-        print(f"   Alt: {altitude:.1f}m - Durum: {fsm.get_state().name}")
-        time.sleep(0.1)
+    alts = np.arange(10.0, 0.5, -0.3)
+    descent_pos = np.broadcast_to(np.array(LASER_POS), (len(alts), 2))
+    fsm.update_batch(np.ones(len(alts), dtype=bool), descent_pos, alts, 0.1)
+    sim_t[0] += len(alts) * 0.1
+    print(f"   Alt: {alts[-1]:.1f}m - Durum: {fsm.get_state().name}")
     
     # 6. Final iniş
     print("\n[6] Final iniş...")
-    fsm.update(laser_detected=True, laser_position=(320, 240), altitude=0.05)
+    fsm.update(laser_detected=True, laser_position=LASER_POS, altitude=0.05)
     print(f"   Durum: {fsm.get_state().name}")
     
     # Durum bilgileri
     print("\n📊 Durum Bilgileri:")
     info = fsm.get_state_info()
-    for key, value in info.items():
+    for key, value in zip(info._fields, info):
         print(f"   {key}: {value}")
     
     # Devre dışı bırak